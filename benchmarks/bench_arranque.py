@@ -0,0 +1,105 @@
+# ==================================================
+# BENCHMARK: ARRANQUE DE LA APP
+# ==================================================
+# Mide el tiempo de importación en frío (un proceso nuevo por medición)
+# del app.py anterior, que lo importaba todo, contra la barra lateral y
+# cada página por separado. También mide el costo de importación por
+# rerun, cuando los módulos ya están en sys.modules.
+#
+# Uso (desde la raíz del repositorio):
+#   python -m benchmarks.bench_arranque
+
+import importlib
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from pqrsdf.paginas import PAGINAS
+
+REPETICIONES = 7
+
+# Lo que importaba app.py antes de separar las páginas
+IMPORTS_ANTERIORES = [
+    "streamlit",
+    "pandas",
+    "plotly.express",
+    "gspread",
+    "google.oauth2.service_account",
+    "smtplib",
+    "email.mime.multipart",
+    "email.mime.text",
+    "email.mime.application",
+    "email.mime.image",
+    "xlsxwriter",
+    "pqrsdf.busqueda",
+    "pqrsdf.correo",
+    "pqrsdf.cubo",
+    "pqrsdf.envio",
+    "pqrsdf.exportacion",
+    "pqrsdf.notificaciones",
+    "pqrsdf.preparacion",
+    "pqrsdf.refresco",
+    "pqrsdf.responsables",
+    "pqrsdf.sincronizacion",
+    "pqrsdf.sla",
+]
+
+# Lo que importa app.py antes de pintar la barra lateral
+IMPORTS_BARRA_LATERAL = ["streamlit", "pqrsdf.medicion", "pqrsdf.paginas", "pqrsdf.refresco"]
+
+PESADOS = ["pandas", "plotly.express", "gspread", "google.oauth2", "smtplib", "xlsxwriter"]
+
+MEDIR = """
+import importlib, json, sys, time
+t = time.perf_counter()
+for m in {modulos!r}:
+    importlib.import_module(m)
+print(json.dumps({{
+    "segundos": time.perf_counter() - t,
+    "pesados": [p for p in {pesados!r} if p in sys.modules]
+}}))
+"""
+
+
+def importar_en_frio(modulos):
+    codigo = MEDIR.format(modulos=modulos, pesados=PESADOS)
+    medidas = []
+    for _ in range(REPETICIONES):
+        salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+        medidas.append(json.loads(salida.stdout))
+    return statistics.median(m["segundos"] for m in medidas), medidas[-1]["pesados"]
+
+
+def importar_en_rerun(modulos, repeticiones=1000):
+    for m in modulos:
+        importlib.import_module(m)
+    t = time.perf_counter()
+    for _ in range(repeticiones):
+        for m in modulos:
+            importlib.import_module(m)
+    return (time.perf_counter() - t) / repeticiones
+
+
+def main():
+    filas = {}
+
+    segundos, pesados = importar_en_frio(IMPORTS_ANTERIORES)
+    filas["app.py anterior (todo)"] = (segundos, pesados, importar_en_rerun(IMPORTS_ANTERIORES))
+
+    segundos, pesados = importar_en_frio(IMPORTS_BARRA_LATERAL)
+    filas["barra lateral"] = (segundos, pesados, importar_en_rerun(IMPORTS_BARRA_LATERAL))
+
+    for nombre, modulo in PAGINAS.items():
+        modulos = IMPORTS_BARRA_LATERAL + [modulo]
+        segundos, pesados = importar_en_frio(modulos)
+        filas[nombre] = (segundos, pesados, importar_en_rerun(modulos))
+
+    print(f"Importación en frío (mediana de {REPETICIONES} procesos) y por rerun")
+    for nombre, (segundos, pesados, rerun) in filas.items():
+        print(f"  {nombre:<28} {segundos * 1000:8.0f} ms  rerun {rerun * 1e6:6.1f} µs  {', '.join(pesados) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
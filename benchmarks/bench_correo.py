@@ -0,0 +1,108 @@
+# ==================================================
+# BENCHMARK: RENDERIZADO DE NOTIFICACIONES
+# ==================================================
+# 500 áreas x 200 casos. Compara el renderizado anterior (iterrows + firma
+# en base64 dentro del HTML) con pqrsdf.correo.
+#
+# Uso (desde la raíz del repositorio):
+#   python -m benchmarks.bench_correo
+
+import base64
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import numpy as np
+import pandas as pd
+
+from pqrsdf.correo import RUTA_FIRMA, cargar_firma, construir_mensaje, filas_html
+
+AREAS = 500
+CASOS_POR_AREA = 200
+
+
+def casos_sinteticos(areas=AREAS, casos=CASOS_POR_AREA, semilla=0):
+    rng = np.random.default_rng(semilla)
+    n = areas * casos
+    hoy = pd.Timestamp.today().normalize()
+
+    df = pd.DataFrame({
+        "num caso": np.arange(1, n + 1),
+        "area_clave": np.repeat([f"área {i}" for i in range(areas)], casos),
+        "Categoría": rng.choice(["Petición", "Queja", "Reclamo", "Derecho de petición"], n),
+        "Ext de tiempos": rng.choice(["", "Si"], n),
+        "Fecha cierre": hoy + pd.to_timedelta(rng.integers(-30, 30, n), "D"),
+    })
+    df['Dias_restantes'] = (df['Fecha cierre'] - hoy).dt.days
+    return df
+
+
+def mensaje_anterior(area, df_area, firma_base64):
+    tabla_html = """
+    <table border='1' cellpadding='6' cellspacing='0' style='border-collapse:collapse;'>
+    <tr style='background-color:#9B0029;color:white;'>
+        <th>Caso</th><th>Categoría</th><th>Ext de tiempos</th><th>Vencimiento</th><th>Días</th>
+    </tr>
+    """
+    for _, row in df_area.iterrows():
+        color = "background-color:#ffcccc;" if row['Dias_restantes'] < 0 else ""
+        tabla_html += f"""
+        <tr style='{color}'>
+            <td>{row['num caso']}</td>
+            <td>{row.get('Categoría', '')}</td>
+            <td>{row.get('Ext de tiempos', '')}</td>
+            <td>{row['Fecha cierre'].date() if pd.notna(row['Fecha cierre']) else ''}</td>
+            <td>{row['Dias_restantes']}</td>
+        </tr>
+        """
+    tabla_html += "</table>"
+
+    cuerpo = f"""
+    <html><body>
+    <p>Estos son los casos en proceso del área <strong>{area.title()}</strong>:</p>
+    {tabla_html}
+    <img src="data:image/jpeg;base64,{firma_base64}" width="500">
+    </body></html>
+    """
+
+    msg = MIMEMultipart()
+    msg['Subject'] = f"PQRSDF - Casos en proceso - {area.title()}"
+    msg.attach(MIMEText(cuerpo, 'html'))
+    return msg
+
+
+def medir(nombre, grupos, construir, preparar=None):
+    inicio = time.perf_counter()
+    if preparar is not None:
+        preparar()
+    tamanos = [len(construir(area, df_area).as_string()) for area, df_area in grupos]
+    segundos = time.perf_counter() - inicio
+
+    print(
+        f"{nombre:<10} {segundos:8.2f} s   "
+        f"{segundos / len(grupos) * 1000:7.2f} ms/mensaje   "
+        f"{np.mean(tamanos) / 1024:7.1f} KB/mensaje"
+    )
+
+
+def main():
+    df = casos_sinteticos()
+    grupos = list(df.groupby('area_clave', sort=False))
+    print(f"{len(grupos)} áreas x {CASOS_POR_AREA} casos")
+
+    with open(RUTA_FIRMA, "rb") as f:
+        firma_base64 = base64.b64encode(f.read()).decode()
+    medir("anterior", grupos, lambda area, d: mensaje_anterior(area, d, firma_base64))
+
+    firma = cargar_firma()
+    filas = {}
+    medir(
+        "actual",
+        grupos,
+        lambda area, d: construir_mensaje(area, filas["todas"].loc[d.index], "pqrsdf@urosario.edu.co", ["a@urosario.edu.co"], firma),
+        preparar=lambda: filas.update(todas=filas_html(df))
+    )
+
+
+if __name__ == "__main__":
+    main()
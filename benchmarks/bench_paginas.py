@@ -0,0 +1,208 @@
+# ==================================================
+# BENCHMARK: CÁLCULOS DE CADA PÁGINA (SIN UI)
+# ==================================================
+# Sobre datos sintéticos (benchmarks/sinteticos.py) mide lo que hace cada
+# página sin Streamlit: preparación, SLA, métricas de seguimiento, cubo
+# del indicador, índice y consultas de búsqueda, exportación a Excel y
+# notificaciones (armado y despacho contra un SMTP local).
+#
+# El resultado se guarda en JSON para comparar entre commits.
+#
+# Uso (desde la raíz del repositorio):
+#   python -m benchmarks.bench_paginas --casos 100000 1000000
+#   python -m benchmarks.bench_paginas --comparar .cache/benchmarks/<commit>.json
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.sinteticos import generar_casos, generar_responsables
+from benchmarks.sumidero_smtp import SumideroSMTP
+from pqrsdf.busqueda import IndiceCasos
+from pqrsdf.correo import cargar_firma
+from pqrsdf.cubo import CATEGORIAS_INDICADOR, construir_cubo, resumir
+from pqrsdf.envio import Despachador
+from pqrsdf.exportacion import Exportador, escribir_archivo, huella_datos
+from pqrsdf.notificaciones import construir_notificaciones
+from pqrsdf.preparacion import columnas_originales, preparar
+from pqrsdf.responsables import leer_responsables
+from pqrsdf.seguimiento import clasificar, filtrar, resumen
+from pqrsdf.sla import calcular_sla
+
+CARPETA_RESULTADOS = ".cache/benchmarks"
+
+# Una regresión se marca cuando la mediana empeora más que esto
+TOLERANCIA = 1.2
+
+
+def medir(funcion, repeticiones):
+    tiempos = []
+    resultado = None
+    for _ in range(repeticiones):
+        t = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - t)
+    return resultado, {
+        "mediana": statistics.median(tiempos),
+        "minimo": min(tiempos),
+        "repeticiones": repeticiones
+    }
+
+
+def correr(casos, repeticiones, carpeta):
+    resultados = {}
+    hoy = pd.Timestamp.today().normalize()
+
+    crudo = generar_casos(casos, hoy=hoy)
+    ruta_responsables = os.path.join(carpeta, "responsables.xlsx")
+    generar_responsables().to_excel(ruta_responsables, index=False)
+
+    def etapa(nombre, funcion):
+        resultado, resultados[nombre] = medir(funcion, repeticiones)
+        print(f"  {casos:>9} casos  {nombre:<24} {resultados[nombre]['mediana'] * 1000:10.1f} ms")
+        return resultado
+
+    # Carga
+    df = etapa("preparar", lambda: preparar(crudo))
+    sla = etapa("sla", lambda: calcular_sla(df, hoy))
+
+    # 📌 Seguimiento: todas las áreas del año más reciente y el área más grande
+    anio = max(df['AÑO'].dropna().unique())
+    area = df['Area principal'].value_counts().index[0]
+
+    def seguimiento():
+        estado = clasificar(df, sla['Dias_restantes'])
+        for filtro in ("Todas", area):
+            resumen(filtrar(df, anio, filtro), estado, sla['Dias_restantes'])
+
+    etapa("seguimiento", seguimiento)
+
+    # 🎯 Indicador: cubo + vista por área
+    cubo = etapa("indicador_cubo", lambda: construir_cubo(df, sla['Dias_restantes']))
+    etapa("indicador_resumen", lambda: resumir(cubo, 'Area principal', anios=[anio], categorias=CATEGORIAS_INDICADOR))
+
+    # 🔎 Búsqueda: índices (el de palabras se arma en la primera búsqueda por
+    # texto) y luego un lote de consultas (números, prefijo, texto)
+    def indexar():
+        indice = IndiceCasos(df)
+        indice.buscar_texto("matrícula")
+        return indice
+
+    indice = etapa("busqueda_indice", indexar)
+    rng = np.random.default_rng(0)
+    numeros = df['num caso'].sample(100, random_state=0).astype(str).tolist() + ["no-existe"]
+
+    def consultas():
+        indice.buscar_numeros(numeros)
+        indice.buscar_prefijo(str(df['num caso'].iloc[int(rng.integers(len(df)))])[:6])
+        indice.buscar_texto("matrícula")
+
+    etapa("busqueda_consultas", consultas)
+
+    # 📥 Exportación: el archivo Excel más grande (área más grande, año más reciente)
+    df_exp = columnas_originales(df[(df['Area principal'] == area) & (df['AÑO'] == anio)])
+    ruta_excel = os.path.join(carpeta, "exportacion.xlsx")
+    etapa("exportacion_excel", lambda: escribir_archivo(ruta_excel, df_exp, "Excel"))
+
+    # 📧 Notificaciones: cada repetición arranca sin adjuntos en caché
+    responsables = leer_responsables(ruta_responsables)
+    firma = cargar_firma()
+    huella = huella_datos(columnas_originales(df))
+
+    def armar():
+        raiz = tempfile.mkdtemp(dir=carpeta)
+        try:
+            return construir_notificaciones(
+                df, sla, responsables, Exportador(huella, raiz), firma, "pqrsdf@ejemplo.edu.co", hoy
+            )
+        finally:
+            shutil.rmtree(raiz, ignore_errors=True)
+
+    notificaciones = etapa("notificaciones_armado", armar)
+
+    with SumideroSMTP() as sumidero:
+        def despachar():
+            despachador = Despachador(
+                host="127.0.0.1", puerto=sumidero.puerto, starttls=False, mensajes_por_minuto=None
+            )
+            entregas = despachador.enviar([n.mensaje for n in notificaciones])
+            if not all(e.enviado for e in entregas):
+                raise RuntimeError("El sumidero SMTP rechazó mensajes")
+
+        etapa("notificaciones_envio", despachar)
+
+    resultados["_datos"] = {
+        "casos_abiertos": int((~df['is_closed']).sum()),
+        "notificaciones": len(notificaciones),
+        "filas_exportacion": len(df_exp)
+    }
+    return resultados
+
+
+def commit_actual():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(actual, anterior):
+    print(f"\nComparación con {anterior.get('commit')} ({anterior.get('fecha')})")
+    for casos, etapas in actual["resultados"].items():
+        previas = anterior.get("resultados", {}).get(casos, {})
+        for nombre, medida in etapas.items():
+            if nombre.startswith("_") or nombre not in previas:
+                continue
+            razon = medida["mediana"] / previas[nombre]["mediana"]
+            marca = "  ⚠ regresión" if razon > TOLERANCIA else ""
+            print(f"  {casos:>9} casos  {nombre:<24} x{razon:5.2f}{marca}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_paginas")
+    parser.add_argument("--casos", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--salida", help=f"JSON de resultados (por defecto {CARPETA_RESULTADOS}/<commit>.json)")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior")
+    args = parser.parse_args()
+
+    commit = commit_actual()
+    informe = {
+        "commit": commit,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "cpus": os.cpu_count(),
+        "resultados": {}
+    }
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        for casos in args.casos:
+            informe["resultados"][str(casos)] = correr(casos, args.repeticiones, carpeta)
+
+    salida = args.salida or os.path.join(CARPETA_RESULTADOS, f"{commit or 'sin_commit'}.json")
+    os.makedirs(os.path.dirname(salida) or ".", exist_ok=True)
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump(informe, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados en {salida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            comparar(informe, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# ==================================================
+# DATOS SINTÉTICOS
+# ==================================================
+# Casos con el mismo esquema de la hoja PQRSDF (textos y fechas como los
+# entrega Google Sheets) y un responsables.xlsx que enruta las mismas
+# combinaciones área/dependencia.
+#
+# El reparto entre áreas sigue una ley de Zipf: `sesgo=0` es uniforme;
+# con `sesgo=1.2` el área más grande concentra ~30% de los casos (40 áreas).
+#
+# Uso (desde la raíz del repositorio):
+#   python -m benchmarks.sinteticos --casos 100000 --carpeta .cache/sinteticos
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from pqrsdf.sla import PLAZO_POR_DEFECTO
+
+AREAS = 40
+SESGO = 1.2
+ANIOS = 3
+
+CATEGORIAS = {
+    "Petición": 0.35,
+    "Queja": 0.20,
+    "Reclamo": 0.15,
+    "Derecho de petición": 0.10,
+    "Solicitud de información": 0.08,
+    "Consulta": 0.05,
+    "Sugerencia": 0.04,
+    "Felicitación": 0.03,
+}
+
+SOLICITANTES = ["Ana Pérez", "Juan Gómez", "Luisa Díaz", "Carlos Rodríguez", "María Fernanda López", "Andrés Castro"]
+DESCRIPCIONES = [
+    "Solicitud de certificado de notas",
+    "Queja por atención en ventanilla",
+    "Reclamo por cobro de matrícula",
+    "Consulta sobre homologación",
+    "Petición de cambio de horario",
+    "Felicitación al equipo de bienestar",
+]
+
+DOMINIO = "ejemplo.edu.co"
+
+
+def areas_y_dependencias(areas=AREAS, semilla=0):
+    # Cada área tiene su fila principal (dependencia = área) y 0 a 4 dependencias más
+    rng = np.random.default_rng(semilla)
+    pares = []
+    for i in range(areas):
+        area = f"Área {i + 1:02d}"
+        pares.append((area, area))
+        pares.extend((area, f"Dependencia {i + 1:02d}.{j + 1}") for j in range(rng.integers(0, 5)))
+    return pares
+
+
+def pesos_zipf(n, sesgo=SESGO):
+    pesos = 1 / np.arange(1, n + 1) ** sesgo
+    return pesos / pesos.sum()
+
+
+def generar_casos(casos, areas=AREAS, sesgo=SESGO, anios=ANIOS, hoy=None, semilla=0):
+    rng = np.random.default_rng(semilla)
+    hoy = pd.Timestamp(hoy or pd.Timestamp.today()).normalize()
+
+    # Área (con sesgo) y luego una de sus dependencias, uniforme
+    pares = areas_y_dependencias(areas, semilla)
+    nombres_area = list(dict.fromkeys(a for a, _ in pares))
+    idx_area = rng.choice(len(nombres_area), casos, p=pesos_zipf(len(nombres_area), sesgo))
+
+    deps_por_area = [[d for a, d in pares if a == area] for area in nombres_area]
+    cuantas = np.array([len(d) for d in deps_por_area])
+    inicio = np.concatenate([[0], np.cumsum(cuantas)[:-1]])
+    todas_deps = np.array([d for deps in deps_por_area for d in deps], dtype=object)
+    idx_dep = inicio[idx_area] + (rng.random(casos) * cuantas[idx_area]).astype(int)
+
+    # Radicación uniforme en los últimos `anios` años
+    dias_atras = rng.integers(0, 365 * anios, casos)
+    radicado = hoy.to_datetime64().astype("datetime64[D]") - dias_atras
+
+    # Vencimiento: plazo en días calendario (~15 hábiles) con algo de ruido
+    cierre = radicado + (PLAZO_POR_DEFECTO * 7 // 5 + rng.integers(-5, 10, casos))
+
+    # Casos recientes: la mayoría abiertos; antiguos: casi todos cerrados
+    abierto = rng.random(casos) < np.where(dias_atras < 45, 0.7, 0.02)
+    sla_si = rng.random(casos) < 0.85
+
+    categorias = np.array(list(CATEGORIAS), dtype=object)
+    anio = radicado.astype("datetime64[Y]").astype(int) + 1970
+
+    fechas_cierre = np.datetime_as_string(cierre, unit="D").astype(object)
+    fechas_cierre[rng.random(casos) < 0.02] = ""
+
+    return pd.DataFrame({
+        "num caso": anio * 10_000_000 + np.arange(casos),
+        "AÑO": anio,
+        "Area principal": np.array(nombres_area, dtype=object)[idx_area],
+        "Dependencia": todas_deps[idx_dep],
+        "Categoría": categorias[rng.choice(len(categorias), casos, p=list(CATEGORIAS.values()))],
+        "Estado": np.where(abierto, "En proceso", "Cerrado").astype(object),
+        "SLA": np.where(abierto, "", np.where(sla_si, "Si", "No")).astype(object),
+        "Fecha radicado": np.datetime_as_string(radicado, unit="D").astype(object),
+        "Fecha cierre": fechas_cierre,
+        "Ext de tiempos": np.where(rng.random(casos) < 0.05, "Si", "").astype(object),
+        "Nombre solicitante": np.array(SOLICITANTES, dtype=object)[rng.integers(0, len(SOLICITANTES), casos)],
+        "Descripción": np.array(DESCRIPCIONES, dtype=object)[rng.integers(0, len(DESCRIPCIONES), casos)],
+    })
+
+
+def generar_responsables(areas=AREAS, semilla=0, sin_responsable=0.1, malformados=0.02):
+    # Mismas columnas que responsables.xlsx; algunas filas vacías o con direcciones inválidas
+    rng = np.random.default_rng(semilla + 1)
+    filas = []
+    for n, (area, dependencia) in enumerate(areas_y_dependencias(areas, semilla)):
+        azar = rng.random()
+        if azar < sin_responsable:
+            responsable = None
+        elif azar < sin_responsable + malformados:
+            responsable = f"responsable{n}.{DOMINIO}"
+        else:
+            correos = [f"responsable{n}.{k}@{DOMINIO}" for k in range(rng.integers(1, 3))]
+            responsable = "; ".join(correos)
+        filas.append({
+            "AREA-general": area,
+            "Area principal": area,
+            "Dependencia": dependencia,
+            "Responsable": responsable
+        })
+    return pd.DataFrame(filas, columns=["AREA-general", "Area principal", "Dependencia", "Responsable"])
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.sinteticos")
+    parser.add_argument("--casos", type=int, default=100_000)
+    parser.add_argument("--areas", type=int, default=AREAS)
+    parser.add_argument("--sesgo", type=float, default=SESGO)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--carpeta", default=".cache/sinteticos")
+    args = parser.parse_args()
+
+    os.makedirs(args.carpeta, exist_ok=True)
+    casos = generar_casos(args.casos, args.areas, args.sesgo, semilla=args.semilla)
+    casos.to_parquet(os.path.join(args.carpeta, f"casos_{args.casos}.parquet"), index=False)
+    generar_responsables(args.areas, args.semilla).to_excel(
+        os.path.join(args.carpeta, "responsables.xlsx"), index=False
+    )
+
+    por_area = casos['Area principal'].value_counts(normalize=True)
+    print(f"{len(casos)} casos en {args.carpeta}; área más grande {por_area.iloc[0]:.1%}, más pequeña {por_area.iloc[-1]:.2%}")
+
+
+if __name__ == "__main__":
+    main()
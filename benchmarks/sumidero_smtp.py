@@ -0,0 +1,85 @@
+# ==================================================
+# SUMIDERO SMTP LOCAL
+# ==================================================
+# Servidor SMTP mínimo (solo biblioteca estándar) que acepta y descarta
+# todo lo que recibe. Sirve para medir el despacho sin tocar Office365.
+#
+# `fallos`: respuestas al DATA que se usan, en orden, antes de volver a
+# aceptar ("451 ..." o "554 ..." se envían tal cual; "cortar" cierra la
+# conexión sin responder).
+
+import socketserver
+import threading
+
+
+class _Sesion(socketserver.StreamRequestHandler):
+
+    def responder(self, linea):
+        self.wfile.write(linea.encode() + b"\r\n")
+
+    def handle(self):
+        self.server.contar_conexion()
+        self.responder("220 sumidero listo")
+        while True:
+            linea = self.rfile.readline()
+            if not linea:
+                return
+            comando = linea.decode(errors="replace").strip().upper()
+
+            if comando.startswith(("EHLO", "HELO")):
+                self.responder("250 sumidero")
+            elif comando == "DATA":
+                self.responder("354 fin con <CRLF>.<CRLF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                fallo = self.server.siguiente_fallo()
+                if fallo == "cortar":
+                    return
+                if fallo:
+                    self.responder(fallo)
+                    continue
+                self.server.recibidos += 1
+                self.responder("250 recibido")
+            elif comando == "QUIT":
+                self.responder("221 adiós")
+                return
+            else:
+                # MAIL, RCPT, RSET, NOOP
+                self.responder("250 ok")
+
+
+class SumideroSMTP(socketserver.ThreadingTCPServer):
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", puerto=0):
+        super().__init__((host, puerto), _Sesion)
+        self.recibidos = 0
+        self.conexiones = 0
+        self.fallos = []
+        self._lock = threading.Lock()
+        self._hilo = None
+
+    def contar_conexion(self):
+        with self._lock:
+            self.conexiones += 1
+
+    def siguiente_fallo(self):
+        with self._lock:
+            return self.fallos.pop(0) if self.fallos else None
+
+    @property
+    def puerto(self):
+        return self.server_address[1]
+
+    def __enter__(self):
+        self._hilo = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, name="sumidero-smtp", daemon=True
+        )
+        self._hilo.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
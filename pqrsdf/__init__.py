@@ -0,0 +1,4 @@
+# ==================================================
+# PQRSDF | Universidad del Rosario
+# Lógica compartida por la app de Streamlit
+# ==================================================
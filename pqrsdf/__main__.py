@@ -0,0 +1,165 @@
+import argparse
+import os
+import sys
+import tomllib
+
+import pandas as pd
+
+from pqrsdf.correo import RUTA_FIRMA, cargar_firma
+from pqrsdf.envio import Despachador
+from pqrsdf.exportacion import Exportador, huella_datos
+from pqrsdf.medicion import tramo, trazar
+from pqrsdf.notificaciones import RUTA_BITACORA, Bitacora, construir_notificaciones, guardar_eml, marcas_seguimiento
+from pqrsdf.preparacion import columnas_originales, preparar
+from pqrsdf.responsables import RUTA_RESPONSABLES, indice_responsables
+from pqrsdf.sincronizacion import RUTA_SNAPSHOT, Snapshot
+from pqrsdf.sla import calcular_sla
+
+# ==================================================
+# LÍNEA DE COMANDOS
+# ==================================================
+#   python -m pqrsdf notify                       envía las notificaciones del día
+#   python -m pqrsdf notify --dry-run correos/    escribe .eml en lugar de enviar
+#
+# No importa Streamlit. Los datos salen del snapshot local; solo se consulta
+# Google Sheets si no hay snapshot o se pide --actualizar.
+
+RUTA_SECRETOS = ".streamlit/secrets.toml"
+SECRETOS = ["EMAIL_USER", "EMAIL_PASSWORD", "GOOGLE_SHEETS_ID"]
+
+# Remitente de las vistas previas (--dry-run) cuando no hay credenciales
+REMITENTE_VISTA_PREVIA = "pqrsdf@example.invalid"
+
+
+def leer_secretos(ruta=RUTA_SECRETOS):
+    # Mismo archivo que usa st.secrets; las variables de entorno tienen prioridad
+    secretos = {}
+    if os.path.exists(ruta):
+        with open(ruta, "rb") as f:
+            secretos.update(tomllib.load(f))
+    for nombre in SECRETOS:
+        if os.environ.get(nombre):
+            secretos[nombre] = os.environ[nombre]
+    return secretos
+
+
+def cargar_casos(ruta_snapshot, secretos, actualizar=False):
+    if actualizar or not os.path.exists(ruta_snapshot):
+        from pqrsdf.sincronizacion import NOMBRE_HOJA, FuenteGoogleSheets, conectar_google, sincronizar
+
+        if not secretos.get("GOOGLE_SHEETS_ID"):
+            raise SystemExit("Falta GOOGLE_SHEETS_ID para descargar la hoja.")
+        sheet = conectar_google().open_by_key(secretos["GOOGLE_SHEETS_ID"]).worksheet(NOMBRE_HOJA)
+        return sincronizar(FuenteGoogleSheets(sheet), ruta_snapshot)
+
+    return Snapshot(ruta_snapshot).dataframe()
+
+
+def notificar(args):
+    secretos = leer_secretos(args.secretos)
+    remitente = secretos.get("EMAIL_USER")
+    if not remitente:
+        if not args.dry_run:
+            raise SystemExit("Falta EMAIL_USER (variable de entorno o secrets.toml).")
+        # Una vista previa no envía nada: no hace falta la cuenta real
+        remitente = REMITENTE_VISTA_PREVIA
+        print(f"Sin EMAIL_USER: los .eml salen con remitente {remitente}.")
+
+    hoy = pd.Timestamp(args.fecha or pd.Timestamp.today()).normalize()
+    crudo = cargar_casos(args.snapshot, secretos, args.actualizar)
+    with tramo("preparar", filas=len(crudo)):
+        df = preparar(crudo)
+
+    notificaciones = construir_notificaciones(
+        df,
+        calcular_sla(df, hoy),
+        indice_responsables(args.responsables),
+        Exportador(huella_datos(columnas_originales(df))),
+        cargar_firma(args.firma),
+        remitente,
+        hoy
+    )
+
+    bitacora = Bitacora(args.bitacora)
+    pendientes = notificaciones if args.forzar else bitacora.pendientes(notificaciones, hoy.date())
+    omitidas = len(notificaciones) - len(pendientes)
+
+    print(f"{len(df)} casos, {len(notificaciones)} notificaciones, {omitidas} ya enviadas hoy.")
+
+    if args.dry_run:
+        for ruta in guardar_eml(pendientes, args.dry_run):
+            print(f"  {ruta}")
+        print(f"{len(pendientes)} correos escritos en {args.dry_run} (no se envió nada).")
+        return 0
+
+    if not pendientes:
+        return 0
+
+    if not secretos.get("EMAIL_PASSWORD"):
+        raise SystemExit("Falta EMAIL_PASSWORD (variable de entorno o secrets.toml).")
+
+    entregas = Despachador(remitente, secretos["EMAIL_PASSWORD"]).enviar([n.mensaje for n in pendientes])
+    enviados = bitacora.registrar(pendientes, entregas, hoy.date())
+
+    for entrega in entregas:
+        estado = "enviado" if entrega.enviado else f"ERROR: {entrega.error}"
+        print(f"  {entrega.clave.title()}: {estado} ({entrega.intentos} intentos)")
+
+    print(f"Se enviaron {enviados} de {len(pendientes)} notificaciones.")
+
+    if enviados and not args.sin_hoja:
+        escribir_en_hoja(pendientes, entregas, secretos)
+
+    return 0 if enviados == len(pendientes) else 1
+
+
+def escribir_en_hoja(notificaciones, entregas, secretos):
+    # Última notificación / destinatarios / vencido, en un solo batch_update.
+    # Un fallo aquí no anula el envío: queda registrado en la bitácora.
+    from pqrsdf.escritura import ColaEscritura
+    from pqrsdf.sincronizacion import NOMBRE_HOJA, conectar_google
+
+    if not secretos.get("GOOGLE_SHEETS_ID"):
+        print("Sin GOOGLE_SHEETS_ID: no se actualiza la hoja.")
+        return
+
+    try:
+        sheet = conectar_google().open_by_key(secretos["GOOGLE_SHEETS_ID"]).worksheet(NOMBRE_HOJA)
+        cola = ColaEscritura(sheet)
+        for caso, valores in marcas_seguimiento(notificaciones, entregas, pd.Timestamp.now()):
+            cola.encolar(caso, valores)
+        vaciado = cola.vaciar()
+    except Exception as e:
+        print(f"No se pudo actualizar la hoja: {e}")
+        return
+
+    print(f"Hoja actualizada: {vaciado.celdas} celdas de {vaciado.casos} casos en {vaciado.solicitudes} solicitudes.")
+    if vaciado.sin_fila:
+        print(f"  {len(vaciado.sin_fila)} casos ya no están en la hoja: {', '.join(vaciado.sin_fila[:10])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pqrsdf")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    notify = comandos.add_parser("notify", help="Envía las notificaciones de casos en proceso")
+    notify.add_argument("--dry-run", metavar="CARPETA", help="Escribe los correos como .eml en CARPETA y no envía nada")
+    notify.add_argument("--forzar", action="store_true", help="Reenvía aunque la bitácora diga que ya salieron hoy")
+    notify.add_argument("--sin-hoja", action="store_true", help="No escribe la última notificación en Google Sheets")
+    notify.add_argument("--actualizar", action="store_true", help="Sincroniza con Google Sheets antes de notificar")
+    notify.add_argument("--fecha", help="Fecha de corte (AAAA-MM-DD); por defecto hoy")
+    notify.add_argument("--snapshot", default=RUTA_SNAPSHOT)
+    notify.add_argument("--bitacora", default=RUTA_BITACORA)
+    notify.add_argument("--responsables", default=RUTA_RESPONSABLES)
+    notify.add_argument("--firma", default=RUTA_FIRMA)
+    notify.add_argument("--secretos", default=RUTA_SECRETOS)
+    notify.set_defaults(funcion=notificar)
+
+    args = parser.parse_args(argv)
+    # Los tiempos de la corrida van al mismo registro que los de la app
+    with trazar(args.comando):
+        return args.funcion(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
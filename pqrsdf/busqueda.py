@@ -0,0 +1,233 @@
+import difflib
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+# ==================================================
+# ÍNDICE DE BÚSQUEDA DE CASOS
+# ==================================================
+# Se construye una vez por versión de datos:
+#   - Index de pandas (tabla hash) de `num caso` -> posiciones
+#   - arreglo ordenado de `num caso` para búsqueda por prefijo
+#   - índice de palabras sobre columnas de texto libre (se arma en la
+#     primera búsqueda por texto); búsqueda difusa cuando una palabra no
+#     aparece tal cual ("gomz" encuentra "gomez")
+#   - índice de trigramas del vocabulario (se arma en la primera búsqueda
+#     difusa): acota las palabras que se comparan con difflib
+
+COLUMNA_CLAVE = "num caso"
+
+SEPARADORES_LISTA = re.compile(r"[\s,;]+")
+PATRON_PALABRA = r"[a-z0-9@._-]{2,}"
+
+# Búsqueda difusa: palabras del índice parecidas a la de la consulta
+SIMILITUD_MINIMA = 0.75
+DIFERENCIA_LONGITUD = 2
+MAXIMO_PARECIDAS = 5
+# Palabras que comparten más trigramas con la consulta; solo esas pasan a difflib
+MAXIMO_CANDIDATAS = 200
+# Los trigramas se toman de los primeros LARGO_TRIGRAMAS caracteres, de a
+# BLOQUE_TRIGRAMAS palabras (acota la memoria con tokens muy largos)
+LARGO_TRIGRAMAS = 32
+BLOQUE_TRIGRAMAS = 50_000
+
+
+class IndiceCasos:
+
+    def __init__(self, df, columnas_texto=None):
+        self.df = df
+        claves = df[COLUMNA_CLAVE].astype(str).str.strip().to_numpy(dtype=str)
+
+        self._por_clave = pd.Index(claves)
+
+        self._orden = np.argsort(claves, kind="stable")
+        self._claves_ordenadas = claves[self._orden]
+
+        if columnas_texto is None:
+            columnas_texto = [
+                c for c in df.columns
+                if c != COLUMNA_CLAVE and (df[c].dtype == object or pd.api.types.is_string_dtype(df[c].dtype))
+            ]
+        self.columnas_texto = columnas_texto
+
+        self._palabras = None
+        self._trigramas = None
+        self._lock = threading.Lock()
+
+    # ------------------------------
+    # Por número (uno o muchos)
+    # ------------------------------
+    def buscar_numeros(self, numeros):
+        consultas = pd.Index([str(n).strip() for n in numeros if str(n).strip()]).unique()
+        if self._por_clave.empty:
+            return self.df.iloc[:0], list(consultas)
+
+        posiciones, faltantes = self._por_clave.get_indexer_non_unique(consultas)
+
+        encontradas = np.unique(posiciones[posiciones >= 0])
+        return self.df.iloc[encontradas], list(consultas[faltantes])
+
+    # ------------------------------
+    # Por prefijo
+    # ------------------------------
+    def buscar_prefijo(self, prefijo, limite=500):
+        prefijo = prefijo.strip()
+        inicio = np.searchsorted(self._claves_ordenadas, prefijo, side="left")
+        fin = np.searchsorted(self._claves_ordenadas, prefijo + "\U0010ffff", side="left")
+
+        posiciones = np.sort(self._orden[inicio:min(fin, inicio + limite)])
+        return self.df.iloc[posiciones], fin - inicio
+
+    # ------------------------------
+    # Por texto libre (todas las palabras deben aparecer, con errores de tipeo)
+    # ------------------------------
+    def buscar_texto(self, consulta, limite=500):
+        palabras, inicios, filas, longitudes = self._indice_palabras()
+
+        resultado = None
+        for palabra in _normalizar(pd.Series([consulta])).str.findall(PATRON_PALABRA).iloc[0]:
+            # Cada palabra de la consulta se toma como prefijo: "gom" encuentra "gomez"
+            desde = np.searchsorted(palabras, palabra, side="left")
+            hasta = np.searchsorted(palabras, palabra + "\U0010ffff", side="left")
+
+            if desde < hasta:
+                coincidencias = np.unique(filas[inicios[desde]:inicios[hasta]])
+            else:
+                # Sin prefijo: palabras parecidas ("gomz" -> "gomez")
+                parecidas = _parecidas(palabra, palabras, longitudes, self._indice_trigramas())
+                coincidencias = np.unique(np.concatenate(
+                    [filas[inicios[i]:inicios[i + 1]] for i in parecidas] or [np.array([], dtype=int)]
+                ))
+
+            resultado = coincidencias if resultado is None else np.intersect1d(resultado, coincidencias)
+            if not len(resultado):
+                break
+
+        if resultado is None:
+            resultado = np.array([], dtype=int)
+
+        return self.df.iloc[resultado[:limite]], len(resultado)
+
+    def _indice_palabras(self):
+        with self._lock:
+            if self._palabras is None:
+                self._palabras = _construir_indice_palabras(self.df, self.columnas_texto)
+            return self._palabras
+
+    def _indice_trigramas(self):
+        palabras = self._indice_palabras()[0]
+        with self._lock:
+            if self._trigramas is None:
+                self._trigramas = _construir_indice_trigramas(palabras)
+            return self._trigramas
+
+
+def _trigramas(palabra):
+    marcada = f"${palabra}$"
+    return {marcada[i:i + 3] for i in range(len(marcada) - 2)}
+
+
+def _codigos_trigramas(palabras):
+    # Cada trigrama de "$palabra$" como un entero (3 puntos de código de 21
+    # bits); devuelve (códigos, posición de la palabra en `palabras`)
+    recortadas = np.asarray(palabras, dtype=str).astype(f"<U{LARGO_TRIGRAMAS}")
+    codigos, posiciones = [np.array([], dtype=np.int64)], [np.array([], dtype=np.int64)]
+
+    for inicio in range(0, len(recortadas), BLOQUE_TRIGRAMAS):
+        marcadas = np.char.add(np.char.add("$", recortadas[inicio:inicio + BLOQUE_TRIGRAMAS]), "$")
+        ancho = marcadas.dtype.itemsize // 4
+        puntos = marcadas.view(np.uint32).reshape(len(marcadas), ancho).astype(np.int64)
+        cantidad = np.char.str_len(marcadas) - 2
+
+        bloque = (puntos[:, :-2] << 42) | (puntos[:, 1:-1] << 21) | puntos[:, 2:]
+        validos = np.arange(ancho - 2) < cantidad[:, None]
+        filas = np.broadcast_to(np.arange(inicio, inicio + len(marcadas))[:, None], bloque.shape)
+        codigos.append(bloque[validos])
+        posiciones.append(filas[validos])
+
+    return np.concatenate(codigos), np.concatenate(posiciones)
+
+
+def _construir_indice_trigramas(palabras):
+    # Mismo formato compacto que el índice de palabras: códigos ordenados +
+    # inicios + posiciones de las palabras que contienen cada trigrama
+    codigos, posiciones = _codigos_trigramas(palabras)
+
+    orden = np.lexsort((posiciones, codigos))
+    codigos, posiciones = codigos[orden], posiciones[orden]
+    # Un trigrama repetido en la misma palabra cuenta una vez
+    distintos = np.ones(len(codigos), dtype=bool)
+    distintos[1:] = (codigos[1:] != codigos[:-1]) | (posiciones[1:] != posiciones[:-1])
+    codigos, posiciones = codigos[distintos], posiciones[distintos]
+
+    unicos, inicios = np.unique(codigos, return_index=True)
+    return unicos, np.append(inicios, len(codigos)), posiciones
+
+
+def _parecidas(palabra, palabras, longitudes, trigramas):
+    # Posiciones en `palabras` (ordenadas) de las más parecidas a `palabra`.
+    # Candidatas: longitud similar y la mayor cantidad de trigramas en común
+    # (a lo sumo MAXIMO_CANDIDATAS, sin importar el tamaño del vocabulario)
+    unicos, inicios, posiciones = trigramas
+    consulta = np.unique(_codigos_trigramas(np.array([palabra]))[0])
+
+    donde = np.searchsorted(unicos, consulta)
+    presentes = donde < len(unicos)
+    donde = donde[presentes][unicos[donde[presentes]] == consulta[presentes]]
+    if not len(donde):
+        return []
+
+    candidatas, comunes = np.unique(
+        np.concatenate([posiciones[inicios[i]:inicios[i + 1]] for i in donde]),
+        return_counts=True
+    )
+    similares = np.abs(longitudes[candidatas] - len(palabra)) <= DIFERENCIA_LONGITUD
+    candidatas, comunes = candidatas[similares], comunes[similares]
+
+    if len(candidatas) > MAXIMO_CANDIDATAS:
+        mejores = np.argpartition(-comunes, MAXIMO_CANDIDATAS)[:MAXIMO_CANDIDATAS]
+        candidatas = candidatas[mejores]
+
+    cercanas = difflib.get_close_matches(palabra, palabras[candidatas].tolist(), MAXIMO_PARECIDAS, SIMILITUD_MINIMA)
+    return np.searchsorted(palabras, cercanas).tolist()
+
+
+def separar_numeros(texto):
+    return [n for n in SEPARADORES_LISTA.split(texto) if n]
+
+
+def _normalizar(serie):
+    # minúsculas y sin tildes
+    return (
+        serie.astype(str).str.lower()
+        .str.normalize("NFKD")
+        .str.encode("ascii", "ignore")
+        .str.decode("ascii")
+    )
+
+
+def _construir_indice_palabras(df, columnas):
+    # Formato compacto: palabras ordenadas + posiciones de inicio + filas
+    posiciones = np.arange(len(df))
+
+    partes = []
+    for col in columnas:
+        # Se tokeniza cada valor distinto una sola vez y luego se cruza con las filas
+        codigos, unicos = pd.factorize(df[col])
+        palabras = _normalizar(pd.Series(unicos, dtype=object)).str.findall(PATRON_PALABRA).explode().dropna()
+
+        por_valor = pd.DataFrame({"palabra": palabras.to_numpy(dtype=str), "codigo": palabras.index.to_numpy()})
+        por_fila = pd.DataFrame({"codigo": codigos, "fila": posiciones})
+        partes.append(por_valor.merge(por_fila, on="codigo")[["palabra", "fila"]])
+
+    if partes:
+        pares = pd.concat(partes).drop_duplicates().sort_values(["palabra", "fila"], kind="stable")
+    else:
+        pares = pd.DataFrame({"palabra": np.array([], dtype=str), "fila": np.array([], dtype=int)})
+
+    palabras, inicios = np.unique(pares["palabra"].to_numpy(dtype=str), return_index=True)
+    inicios = np.append(inicios, len(pares))
+
+    return palabras, inicios, pares["fila"].to_numpy(), np.char.str_len(palabras)
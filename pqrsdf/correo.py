@@ -0,0 +1,123 @@
+from email.mime.application import MIMEApplication
+from email.mime.image import MIMEImage
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from string import Template
+
+import numpy as np
+import pandas as pd
+
+# ==================================================
+# RENDERIZADO DE CORREOS
+# ==================================================
+# Las filas de la tabla se arman con operaciones de columna (sin iterrows)
+# para todos los casos a la vez, sobre una plantilla compilada una sola vez. La firma se lee de disco una
+# vez y viaja como parte `multipart/related` referenciada por CID.
+
+RUTA_FIRMA = "firma.jpg"
+CID_FIRMA = "firma-pqrsdf"
+
+ENCABEZADO_TABLA = (
+    "<table border='1' cellpadding='6' cellspacing='0' style='border-collapse:collapse;'>"
+    "<tr style='background-color:#9B0029;color:white;'>"
+    "<th>Caso</th>"
+    "<th>Categoría</th>"
+    "<th>Ext de tiempos</th>"
+    "<th>Vencimiento</th>"
+    "<th>Días</th>"
+    "</tr>"
+)
+
+ESTILO_VENCIDO = "background-color:#ffcccc;"
+
+PLANTILLA_CUERPO = Template("""
+<html>
+<body>
+<p>Buen día,</p>
+
+<p>Estos son los casos en proceso del área <strong>$area</strong>:</p>
+
+$tabla
+
+<p><strong>Los casos marcados en rojo están vencidos.</strong></p>
+
+<p>Se adjunta archivo Excel con el detalle completo.</p>
+
+<br><br>
+<img src="cid:$cid_firma" width="500">
+
+</body>
+</html>
+""")
+
+
+def cargar_firma(ruta=RUTA_FIRMA):
+    # Una sola parte MIME (ya codificada en base64) compartida por todos los mensajes
+    with open(ruta, "rb") as f:
+        firma = MIMEImage(f.read(), "jpeg")
+
+    firma.add_header("Content-ID", f"<{CID_FIRMA}>")
+    firma.add_header("Content-Disposition", "inline", filename="firma.jpg")
+    return firma
+
+
+def filas_html(df):
+    # Una pasada vectorizada para todos los casos; cada área toma luego sus filas
+    dias = df['Dias_restantes']
+    vencimiento = df['Vencimiento'] if 'Vencimiento' in df.columns else df['Fecha cierre']
+    estilo = pd.Series(np.where(dias < 0, ESTILO_VENCIDO, ""), index=df.index)
+    dias_texto = pd.Series(pd.array(dias, dtype="Int64"), index=df.index).astype("string").fillna('')
+
+    return (
+        "<tr style='" + estilo + "'>"
+        + "<td>" + _texto(df, 'num caso') + "</td>"
+        + "<td>" + _texto(df, 'Categoría') + "</td>"
+        + "<td>" + _texto(df, 'Ext de tiempos') + "</td>"
+        + "<td>" + vencimiento.dt.strftime('%Y-%m-%d').fillna('') + "</td>"
+        + "<td>" + dias_texto + "</td>"
+        + "</tr>"
+    )
+
+
+def tabla_html(filas):
+    return ENCABEZADO_TABLA + "".join(filas) + "</table>"
+
+
+def cuerpo_html(area, filas):
+    return PLANTILLA_CUERPO.substitute(
+        area=_escapar(area.title()),
+        tabla=tabla_html(filas),
+        cid_firma=CID_FIRMA
+    )
+
+
+def construir_mensaje(area, filas, remitente, para, firma, adjunto=None):
+    msg = MIMEMultipart()
+    msg['From'] = remitente
+    msg['To'] = ", ".join(para)
+    msg['Subject'] = f"PQRSDF - Casos en proceso - {area.title()}"
+
+    relacionado = MIMEMultipart("related")
+    relacionado.attach(MIMEText(cuerpo_html(area, filas), 'html'))
+    relacionado.attach(firma)
+    msg.attach(relacionado)
+
+    if adjunto is not None:
+        nombre, datos = adjunto
+        adj = MIMEApplication(datos, Name=nombre)
+        adj['Content-Disposition'] = f'attachment; filename="{nombre}"'
+        msg.attach(adj)
+
+    return msg
+
+
+def _texto(df, columna):
+    if columna not in df.columns:
+        return pd.Series("", index=df.index)
+    return _escapar(df[columna].astype("string").fillna(""))
+
+
+def _escapar(valor):
+    if isinstance(valor, str):
+        return valor.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return valor.str.replace("&", "&amp;").str.replace("<", "&lt;").str.replace(">", "&gt;")
@@ -0,0 +1,67 @@
+import pandas as pd
+
+# ==================================================
+# CUBO SLA
+# ==================================================
+# Conteos por (AÑO, Area principal, Categoría, Mes) calculados una vez por
+# versión de datos y día. Las vistas del indicador se arman sumando filas
+# del cubo, sin volver a recorrer los casos.
+
+DIMENSIONES = ["AÑO", "Area principal", "Categoría", "Mes"]
+MEDIDAS = ["Total", "Cumplen", "No cumplen", "Abiertos", "Vencidos"]
+
+CATEGORIAS_INDICADOR = [
+    "Petición",
+    "Queja",
+    "Reclamo",
+    "Derecho de petición"
+]
+
+
+def construir_cubo(df, dias_restantes):
+    abiertos = ~df['is_closed']
+
+    base = pd.DataFrame({
+        "AÑO": df['AÑO'],
+        "Area principal": df['Area principal'],
+        "Categoría": df['Categoría'],
+        # Mes de vencimiento (Fecha cierre); los casos sin fecha quedan en NaT
+        "Mes": df['Fecha cierre'].dt.to_period('M').dt.to_timestamp(),
+        "Total": 1,
+        "Cumplen": df['sla_ok'],
+        "No cumplen": df['sla_breached'],
+        "Abiertos": abiertos,
+        # Vencido = días hábiles restantes negativos (ver pqrsdf/sla.py)
+        "Vencidos": abiertos & (dias_restantes < 0),
+    })
+
+    return (
+        base.groupby(DIMENSIONES, observed=True, dropna=False)[MEDIDAS]
+        .sum()
+        .reset_index()
+    )
+
+
+def resumir(cubo, por, anios=None, areas=None, categorias=None):
+    filtro = pd.Series(True, index=cubo.index)
+
+    if anios is not None:
+        filtro &= cubo['AÑO'].isin(anios)
+    if areas is not None:
+        filtro &= cubo['Area principal'].isin(areas)
+    if categorias is not None:
+        filtro &= cubo['Categoría'].isin(categorias)
+
+    resumen = (
+        cubo[filtro]
+        .groupby(por, observed=True)[MEDIDAS]
+        .sum()
+        .reset_index()
+    )
+
+    resumen['Indicador (%)'] = round(
+        (resumen['Cumplen']/resumen['Total'])*100,
+        2
+    )
+
+    return resumen
@@ -0,0 +1,197 @@
+import queue
+import random
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from pqrsdf.medicion import en_traza, traza_actual, tramo
+
+# ==================================================
+# DESPACHO DE CORREOS
+# ==================================================
+# Mantiene unas pocas conexiones SMTP autenticadas y las reutiliza entre
+# mensajes. Los envíos salen desde un pool de hilos acotado; los errores
+# transitorios (4xx, conexión caída) se reintentan con espera exponencial.
+
+SMTP_HOST = "smtp.office365.com"
+SMTP_PUERTO = 587
+
+# Office365 admite ~30 mensajes por minuto por buzón
+MENSAJES_POR_MINUTO = 30
+
+
+@dataclass
+class Mensaje:
+    clave: str
+    remitente: str
+    destinatarios: list
+    contenido: object  # email.message.Message
+
+
+@dataclass
+class Entrega:
+    clave: str
+    destinatarios: list
+    enviado: bool = False
+    intentos: int = 0
+    error: str = ""
+    rechazados: dict = field(default_factory=dict)
+
+
+class Despachador:
+
+    def __init__(
+        self,
+        usuario=None,
+        clave=None,
+        host=SMTP_HOST,
+        puerto=SMTP_PUERTO,
+        conexiones=3,
+        reintentos=4,
+        espera_inicial=2.0,
+        starttls=True,
+        mensajes_por_minuto=MENSAJES_POR_MINUTO,
+        timeout=30,
+        dormir=time.sleep
+    ):
+        self.usuario = usuario
+        self.clave = clave
+        self.host = host
+        self.puerto = puerto
+        self.conexiones = conexiones
+        self.reintentos = reintentos
+        self.espera_inicial = espera_inicial
+        self.starttls = starttls
+        self.timeout = timeout
+        self._dormir = dormir
+
+        self._libres = queue.LifoQueue()
+        self._abiertas = []
+        self._lock = threading.Lock()
+
+        self._intervalo = 60 / mensajes_por_minuto if mensajes_por_minuto else 0
+        self._proximo_envio = 0.0
+
+    # ------------------------------
+    # API
+    # ------------------------------
+    def enviar(self, mensajes):
+        # Los tramos de cada hilo (conexión, mensaje) van a la traza de quien llama
+        entregar = en_traza(traza_actual(), self._entregar)
+        try:
+            with tramo("smtp.enviar", mensajes=len(mensajes)), \
+                    ThreadPoolExecutor(max_workers=self.conexiones, thread_name_prefix="pqrsdf-smtp") as pool:
+                return list(pool.map(entregar, mensajes))
+        finally:
+            self.cerrar()
+
+    def cerrar(self):
+        with self._lock:
+            abiertas, self._abiertas = self._abiertas, []
+        while not self._libres.empty():
+            self._libres.get_nowait()
+        for conexion in abiertas:
+            try:
+                conexion.quit()
+            except Exception:
+                pass
+
+    # ------------------------------
+    # Entrega de un mensaje con reintentos
+    # ------------------------------
+    def _entregar(self, mensaje):
+        entrega = Entrega(clave=mensaje.clave, destinatarios=list(mensaje.destinatarios))
+
+        for intento in range(self.reintentos + 1):
+            entrega.intentos = intento + 1
+            try:
+                entrega.rechazados = self._enviar_una_vez(mensaje)
+                entrega.enviado = True
+                entrega.error = ""
+                return entrega
+
+            except Exception as e:
+                entrega.error = str(e)
+                if not es_transitorio(e) or intento == self.reintentos:
+                    return entrega
+                self._dormir(self.espera_inicial * (2 ** intento) * random.uniform(0.8, 1.2))
+
+        return entrega
+
+    def _enviar_una_vez(self, mensaje):
+        conexion = self._tomar_conexion()
+        try:
+            self._esperar_turno()
+            contenido = mensaje.contenido.as_string()
+            with tramo("smtp.mensaje", bytes=len(contenido), destinatarios=len(mensaje.destinatarios)):
+                rechazados = conexion.sendmail(mensaje.remitente, mensaje.destinatarios, contenido)
+        except smtplib.SMTPRecipientsRefused:
+            # smtplib ya hizo RSET: la sesión sigue siendo válida
+            self._devolver(conexion)
+            raise
+        except Exception:
+            self._descartar(conexion)
+            raise
+
+        self._devolver(conexion)
+        return rechazados
+
+    # ------------------------------
+    # Pool de conexiones
+    # ------------------------------
+    def _tomar_conexion(self):
+        try:
+            return self._libres.get_nowait()
+        except queue.Empty:
+            pass
+
+        with tramo("smtp.conexion"):
+            conexion = smtplib.SMTP(self.host, self.puerto, timeout=self.timeout)
+            try:
+                if self.starttls:
+                    conexion.starttls()
+                if self.usuario:
+                    conexion.login(self.usuario, self.clave)
+            except Exception:
+                conexion.close()
+                raise
+
+        with self._lock:
+            self._abiertas.append(conexion)
+        return conexion
+
+    def _devolver(self, conexion):
+        self._libres.put(conexion)
+
+    def _descartar(self, conexion):
+        with self._lock:
+            if conexion in self._abiertas:
+                self._abiertas.remove(conexion)
+        try:
+            conexion.close()
+        except Exception:
+            pass
+
+    def _esperar_turno(self):
+        if not self._intervalo:
+            return
+        with self._lock:
+            ahora = time.monotonic()
+            turno = max(ahora, self._proximo_envio)
+            self._proximo_envio = turno + self._intervalo
+        self._dormir(max(0.0, turno - ahora))
+
+
+def es_transitorio(error):
+    # 4xx y conexiones caídas se reintentan; 5xx y errores de autenticación no
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= codigo < 500 for codigo, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPException):
+        return False
+    return isinstance(error, OSError)
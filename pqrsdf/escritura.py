@@ -0,0 +1,233 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+
+from pqrsdf.medicion import tramo
+from pqrsdf.sincronizacion import COLUMNA_CLAVE
+
+# ==================================================
+# ESCRITURA EN LA HOJA
+# ==================================================
+# Las actualizaciones por caso se acumulan en una cola: varias sobre el
+# mismo caso se funden (gana la última) y al vaciar la cola todo sale en
+# un solo worksheet.batch_update. Las columnas que falten se agregan al
+# final del encabezado en esa misma solicitud.
+#
+# Cuota de Sheets: ~60 solicitudes por minuto por usuario. Las llamadas se
+# espacian y los 429/5xx se reintentan con espera exponencial.
+
+SOLICITUDES_POR_MINUTO = 60
+CODIGOS_TRANSITORIOS = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class Vaciado:
+    casos: int = 0
+    celdas: int = 0
+    solicitudes: int = 0
+    # num caso encolados que ya no están en la hoja (se descartan)
+    sin_fila: list = field(default_factory=list)
+
+
+class ColaEscritura:
+
+    def __init__(
+        self,
+        worksheet,
+        columna_clave=COLUMNA_CLAVE,
+        reintentos=5,
+        espera_inicial=1.0,
+        solicitudes_por_minuto=SOLICITUDES_POR_MINUTO,
+        dormir=time.sleep
+    ):
+        self.worksheet = worksheet
+        self.columna_clave = columna_clave
+        self.reintentos = reintentos
+        self.espera_inicial = espera_inicial
+        self._dormir = dormir
+
+        # num caso -> {columna: valor}
+        self._pendientes = {}
+        self._lock = threading.Lock()
+        self._vaciando = threading.Lock()
+
+        self._intervalo = 60 / solicitudes_por_minuto if solicitudes_por_minuto else 0
+        self._proxima = 0.0
+
+    # ------------------------------
+    # API
+    # ------------------------------
+    def encolar(self, num_caso, valores):
+        with self._lock:
+            self._pendientes.setdefault(str(num_caso).strip(), {}).update(valores)
+
+    @property
+    def pendientes(self):
+        return len(self._pendientes)
+
+    def vaciar(self):
+        # Un vaciado a la vez; lo que llegue mientras tanto espera al siguiente
+        with self._vaciando:
+            with self._lock:
+                lote, self._pendientes = self._pendientes, {}
+
+            if not lote:
+                return Vaciado()
+
+            try:
+                with tramo("sheets.escribir", casos=len(lote)):
+                    return self._escribir(lote)
+            except Exception:
+                # Vuelven a la cola; lo encolado después tiene prioridad
+                with self._lock:
+                    for caso, valores in lote.items():
+                        self._pendientes[caso] = {**valores, **self._pendientes.get(caso, {})}
+                raise
+
+    # ------------------------------
+    # Escritura
+    # ------------------------------
+    def _escribir(self, lote):
+        resultado = Vaciado(casos=len(lote))
+
+        encabezados = [str(c).strip() for c in self._llamar(resultado, self.worksheet.row_values, 1)]
+        if self.columna_clave not in encabezados:
+            raise ValueError(f"La hoja no tiene la columna '{self.columna_clave}'")
+
+        # Columnas en el orden en que se encolaron; las nuevas van al final
+        columnas = list(dict.fromkeys(c for valores in lote.values() for c in valores))
+        nuevas = [c for c in columnas if c not in encabezados]
+        encabezados += nuevas
+        posicion = {c: encabezados.index(c) + 1 for c in columnas}
+
+        if len(encabezados) > self.worksheet.col_count:
+            self._llamar(resultado, self.worksheet.add_cols, len(encabezados) - self.worksheet.col_count)
+
+        # Fila actual de cada caso (la hoja pudo reordenarse desde la última lectura)
+        claves = self._llamar(resultado, self.worksheet.col_values, encabezados.index(self.columna_clave) + 1)
+        filas = {}
+        for fila, valor in enumerate(claves[1:], start=2):
+            filas.setdefault(str(valor).strip(), fila)
+
+        datos = []
+        if nuevas:
+            datos.append(_rango(1, posicion[nuevas[0]], nuevas))
+
+        for caso, valores in lote.items():
+            fila = filas.get(caso)
+            if fila is None:
+                resultado.sin_fila.append(caso)
+                continue
+
+            # Columnas contiguas de una misma fila en un solo rango
+            celdas = sorted((posicion[c], v) for c, v in valores.items())
+            inicio = 0
+            for i in range(1, len(celdas) + 1):
+                if i == len(celdas) or celdas[i][0] != celdas[i - 1][0] + 1:
+                    datos.append(_rango(fila, celdas[inicio][0], [v for _, v in celdas[inicio:i]]))
+                    inicio = i
+            resultado.celdas += len(celdas)
+
+        if datos:
+            # USER_ENTERED: las fechas quedan como fechas en la hoja
+            self._llamar(resultado, self.worksheet.batch_update, datos, raw=False)
+
+        return resultado
+
+    def _llamar(self, resultado, funcion, *args, **kwargs):
+        for intento in range(self.reintentos + 1):
+            self._esperar_turno()
+            resultado.solicitudes += 1
+            try:
+                return funcion(*args, **kwargs)
+            except Exception as e:
+                if not es_transitorio(e) or intento == self.reintentos:
+                    raise
+                self._dormir(self.espera_inicial * (2 ** intento) * random.uniform(0.8, 1.2))
+
+    def _esperar_turno(self):
+        if not self._intervalo:
+            return
+        ahora = time.monotonic()
+        turno = max(ahora, self._proxima)
+        self._proxima = turno + self._intervalo
+        self._dormir(max(0.0, turno - ahora))
+
+
+def es_transitorio(error):
+    # gspread.exceptions.APIError lleva el código HTTP en .code
+    codigo = getattr(error, "code", None)
+    if isinstance(codigo, int):
+        return codigo in CODIGOS_TRANSITORIOS
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def _columna_a1(columna):
+    letras = ""
+    while columna:
+        columna, resto = divmod(columna - 1, 26)
+        letras = chr(65 + resto) + letras
+    return letras
+
+
+def _rango(fila, columna, valores):
+    inicio = f"{_columna_a1(columna)}{fila}"
+    fin = f"{_columna_a1(columna + len(valores) - 1)}{fila}"
+    return {"range": f"{inicio}:{fin}", "values": [list(valores)]}
+
+
+# ==================================================
+# HOJA LOCAL (para pruebas)
+# ==================================================
+class HojaLocal:
+    # Imita los métodos de gspread.Worksheet que usa ColaEscritura.
+    # `fallos` es una lista de excepciones que se lanzan, en orden, antes
+    # de atender las siguientes solicitudes.
+
+    def __init__(self, valores, col_count=None, fallos=None):
+        self.valores = [list(fila) for fila in valores]
+        self.col_count = col_count or max((len(f) for f in self.valores), default=0)
+        self.fallos = list(fallos or [])
+        self.solicitudes = []
+
+    def _atender(self, nombre):
+        self.solicitudes.append(nombre)
+        if self.fallos:
+            raise self.fallos.pop(0)
+
+    def row_values(self, fila):
+        self._atender("row_values")
+        return list(self.valores[fila - 1]) if fila <= len(self.valores) else []
+
+    def col_values(self, columna):
+        self._atender("col_values")
+        return [f[columna - 1] if len(f) >= columna else "" for f in self.valores]
+
+    def add_cols(self, cols):
+        self._atender("add_cols")
+        self.col_count += cols
+
+    def batch_update(self, data, raw=True):
+        self._atender("batch_update")
+        for rango in data:
+            inicio = rango["range"].split(":")[0]
+            letras = inicio.rstrip("0123456789")
+            fila = int(inicio[len(letras):])
+            columna = 0
+            for letra in letras:
+                columna = columna * 26 + ord(letra) - 64
+
+            if columna + len(rango["values"][0]) - 1 > self.col_count:
+                raise ValueError(f"Rango fuera de la hoja: {rango['range']}")
+
+            for desplazamiento, valor in enumerate(rango["values"][0]):
+                self._poner(fila, columna + desplazamiento, valor)
+
+    def _poner(self, fila, columna, valor):
+        while len(self.valores) < fila:
+            self.valores.append([])
+        registro = self.valores[fila - 1]
+        while len(registro) < columna:
+            registro.append("")
+        registro[columna - 1] = valor
@@ -0,0 +1,226 @@
+import hashlib
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import pandas as pd
+import xlsxwriter
+
+from pqrsdf.medicion import tramo
+
+# ==================================================
+# EXPORTACIÓN
+# ==================================================
+# Los archivos se escriben una sola vez por (clave, versión de datos) en
+# .cache/exportaciones/<huella>/ y se reutilizan en descargas y adjuntos.
+# Excel se escribe con xlsxwriter en modo constant_memory (fila a fila).
+
+RAIZ_EXPORTACIONES = ".cache/exportaciones"
+
+FORMATOS = {
+    "Excel": ".xlsx",
+    "CSV": ".csv",
+    "Parquet": ".parquet"
+}
+
+# Carpetas de versiones anteriores: otras cachés (la app guarda dos
+# versiones, `python -m pqrsdf notify` arma la suya) pueden seguir usándolas
+CARPETAS_CONSERVADAS = 4
+EDAD_MINIMA_BORRADO = 60 * 60
+
+# Por debajo de este número de archivos no compensa levantar procesos
+MINIMO_PARA_PROCESOS = 8
+
+CARACTERES_INVALIDOS = re.compile(r"[^\w.-]+")
+CARACTERES_HOJA = re.compile(r"[\[\]:*?/\\]")
+
+
+def huella_datos(df):
+    # Identifica el contenido de los datos; sobrevive a reinicios del proceso
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.sha1(hashes.tobytes()).hexdigest()[:16]
+
+
+def nombre_archivo(area, anio, formato="Excel"):
+    return f"PQRSDF_{str(area).replace(' ', '_')}_{anio}{FORMATOS[formato]}"
+
+
+class Exportador:
+
+    def __init__(self, huella, raiz=RAIZ_EXPORTACIONES):
+        self.huella = huella
+        self.carpeta = os.path.join(raiz, huella)
+        os.makedirs(self.carpeta, exist_ok=True)
+        os.utime(self.carpeta)
+
+        _limpiar(raiz, huella)
+
+    def ruta(self, partes, formato="Excel"):
+        nombre = "__".join(CARACTERES_INVALIDOS.sub("_", str(p)) for p in partes)
+        return os.path.join(self.carpeta, nombre + FORMATOS[formato])
+
+    # ------------------------------
+    # Un archivo
+    # ------------------------------
+    def archivo(self, df, partes, formato="Excel"):
+        ruta = self.ruta(partes, formato)
+        if not os.path.exists(ruta):
+            escribir_archivo(ruta, df, formato)
+        return ruta
+
+    # ------------------------------
+    # Todas las áreas de un año (un solo groupby)
+    # ------------------------------
+    def por_area(self, df, anio, formato="Excel", procesos=None):
+        df_anio = df[df['AÑO'] == anio]
+
+        rutas = {}
+        pendientes = []
+        for area, df_area in df_anio.groupby('Area principal', observed=True):
+            ruta = self.ruta(("area", area, anio), formato)
+            rutas[area] = ruta
+            if not os.path.exists(ruta):
+                pendientes.append((ruta, df_area, formato))
+
+        procesos = procesos or os.cpu_count() or 1
+
+        if procesos > 1 and len(pendientes) >= MINIMO_PARA_PROCESOS:
+            contexto = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as pool:
+                list(pool.map(escribir_archivo, *zip(*pendientes)))
+        else:
+            for pendiente in pendientes:
+                escribir_archivo(*pendiente)
+
+        return rutas
+
+    def zip_por_area(self, df, anio, formato="Excel", procesos=None):
+        ruta_zip = self.ruta(("todas_las_areas", anio, formato), formato).rsplit(".", 1)[0] + ".zip"
+
+        if not os.path.exists(ruta_zip):
+            rutas = self.por_area(df, anio, formato, procesos)
+            with tramo("exportacion.zip", archivos=len(rutas)) as t:
+                with _escritura_atomica(ruta_zip) as temporal:
+                    with zipfile.ZipFile(temporal, "w", zipfile.ZIP_DEFLATED) as zf:
+                        for area, ruta in rutas.items():
+                            zf.write(ruta, nombre_archivo(area, anio, formato))
+                t["bytes"] = os.path.getsize(ruta_zip)
+
+        return ruta_zip
+
+    def libro_por_area(self, df, anio):
+        ruta = self.ruta(("libro_areas", anio), "Excel")
+
+        if not os.path.exists(ruta):
+            df_anio = df[df['AÑO'] == anio]
+            hojas = list(_nombres_hoja(df_anio.groupby('Area principal', observed=True)))
+            with tramo("exportacion.libro", filas=len(df_anio), hojas=len(hojas)) as t:
+                with _escritura_atomica(ruta) as temporal:
+                    _escribir_excel(temporal, hojas)
+                t["bytes"] = os.path.getsize(ruta)
+
+        return ruta
+
+
+def _limpiar(raiz, vigente):
+    # Se borran las carpetas más allá de las CARPETAS_CONSERVADAS usadas más
+    # recientemente, y solo si llevan EDAD_MINIMA_BORRADO sin tocarse
+    carpetas = []
+    for nombre in os.listdir(raiz):
+        ruta = os.path.join(raiz, nombre)
+        try:
+            carpetas.append((os.path.getmtime(ruta), ruta))
+        except OSError:
+            continue
+
+    limite = time.time() - EDAD_MINIMA_BORRADO
+    for modificada, ruta in sorted(carpetas, reverse=True)[CARPETAS_CONSERVADAS:]:
+        if modificada < limite and os.path.basename(ruta) != vigente:
+            shutil.rmtree(ruta, ignore_errors=True)
+
+
+# ==================================================
+# ESCRITORES
+# ==================================================
+def escribir_archivo(ruta, df, formato="Excel"):
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}")
+
+    with tramo(f"exportacion.{formato.lower()}", filas=len(df)) as t:
+        with _escritura_atomica(ruta) as temporal:
+            if formato == "Excel":
+                _escribir_excel(temporal, [("PQRSDF", df)])
+            elif formato == "CSV":
+                df.to_csv(temporal, index=False, encoding="utf-8-sig")
+            else:
+                _para_parquet(df).to_parquet(temporal, index=False)
+        t["bytes"] = os.path.getsize(ruta)
+
+    return ruta
+
+
+@contextmanager
+def _escritura_atomica(ruta):
+    # Se escribe en un temporal y se renombra: nunca queda un archivo a medias.
+    # El temporal es único por llamada (las sesiones de Streamlit son hilos
+    # del mismo proceso y pueden pedir el mismo archivo a la vez); si dos
+    # escriben el mismo archivo, el último os.replace gana con el mismo contenido.
+    carpeta = os.path.dirname(ruta) or "."
+    os.makedirs(carpeta, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=carpeta, prefix=os.path.basename(ruta) + ".", suffix=".tmp")
+    os.close(descriptor)
+
+    try:
+        yield temporal
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+
+def _escribir_excel(ruta, hojas):
+    libro = xlsxwriter.Workbook(ruta, {
+        "constant_memory": True,
+        "default_date_format": "yyyy-mm-dd",
+        "nan_inf_to_errors": True
+    })
+    negrita = libro.add_format({"bold": True})
+
+    for nombre, df in hojas:
+        hoja = libro.add_worksheet(nombre)
+        hoja.write_row(0, 0, [str(c) for c in df.columns], negrita)
+
+        valores = df.astype(object).where(df.notna(), None)
+        for i, fila in enumerate(valores.itertuples(index=False, name=None), start=1):
+            hoja.write_row(i, 0, fila)
+
+    libro.close()
+
+
+def _nombres_hoja(grupos):
+    # Excel: máximo 31 caracteres, sin []:*?/\ y sin repetir
+    usados = set()
+    for area, df_area in grupos:
+        base = CARACTERES_HOJA.sub("_", str(area))[:31] or "Sin area"
+        nombre, n = base, 1
+        while nombre.lower() in usados:
+            n += 1
+            nombre = f"{base[:31 - len(str(n)) - 1]}_{n}"
+        usados.add(nombre.lower())
+        yield nombre, df_area
+
+
+def _para_parquet(df):
+    # La hoja mezcla números y textos en una misma columna; Parquet no lo admite
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) != "string":
+            df[col] = df[col].astype("string")
+    return df
@@ -0,0 +1,61 @@
+from datetime import date, timedelta
+
+# ==================================================
+# FESTIVOS DE COLOMBIA
+# ==================================================
+# Calendario calculado localmente (sin consultar servicios externos):
+#   - Ley 51 de 1983 ("Ley Emiliani"): varios festivos se trasladan al lunes siguiente
+#   - Festivos religiosos móviles a partir del Domingo de Pascua
+
+
+def pascua(anio):
+    # Algoritmo de Meeus/Jones/Butcher (calendario gregoriano)
+    a = anio % 19
+    b, c = divmod(anio, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    mes, dia = divmod(h + l - 7 * m + 114, 31)
+    return date(anio, mes, dia + 1)
+
+
+def _lunes_siguiente(fecha):
+    return fecha + timedelta(days=(7 - fecha.weekday()) % 7)
+
+
+def festivos_colombia(anio):
+    domingo_pascua = pascua(anio)
+
+    fijos = [
+        date(anio, 1, 1),    # Año Nuevo
+        date(anio, 5, 1),    # Día del Trabajo
+        date(anio, 7, 20),   # Independencia
+        date(anio, 8, 7),    # Batalla de Boyacá
+        date(anio, 12, 8),   # Inmaculada Concepción
+        date(anio, 12, 25),  # Navidad
+        domingo_pascua - timedelta(days=3),  # Jueves Santo
+        domingo_pascua - timedelta(days=2),  # Viernes Santo
+    ]
+
+    trasladables = [
+        date(anio, 1, 6),    # Reyes Magos
+        date(anio, 3, 19),   # San José
+        date(anio, 6, 29),   # San Pedro y San Pablo
+        date(anio, 8, 15),   # Asunción de la Virgen
+        date(anio, 10, 12),  # Día de la Raza
+        date(anio, 11, 1),   # Todos los Santos
+        date(anio, 11, 11),  # Independencia de Cartagena
+        domingo_pascua + timedelta(days=39),  # Ascensión del Señor
+        domingo_pascua + timedelta(days=60),  # Corpus Christi
+        domingo_pascua + timedelta(days=68),  # Sagrado Corazón
+    ]
+
+    return sorted(set(fijos) | {_lunes_siguiente(f) for f in trasladables})
+
+
+def festivos_entre(desde, hasta):
+    return [f for anio in range(desde, hasta + 1) for f in festivos_colombia(anio)]
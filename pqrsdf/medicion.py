@@ -0,0 +1,204 @@
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+# ==================================================
+# MEDICIÓN DE TIEMPOS
+# ==================================================
+# Una traza agrupa los tramos medidos durante un rerun de la app (o una
+# recarga de datos, o una corrida de `python -m pqrsdf notify`). Los
+# tramos se anotan con `with tramo("nombre") as t: ...; t["filas"] = n`;
+# sin traza activa no hacen nada.
+#
+# Al cerrar cada traza, el registro la guarda en memoria (panel de
+# administración), la agrega como una línea JSON y, si se configuró,
+# reescribe un archivo en formato de texto de Prometheus.
+#
+#   PQRSDF_TIEMPOS      ruta del JSON lines (por defecto .cache/tiempos.jsonl; vacío = no escribir)
+#   PQRSDF_PROMETHEUS   ruta del archivo .prom (opcional)
+
+RUTA_TIEMPOS = ".cache/tiempos.jsonl"
+
+# En memoria solo se conservan las últimas trazas
+TRAZAS_EN_MEMORIA = 200
+
+# El JSON lines se rota al superar este tamaño (se conserva un .1)
+TAMANO_MAXIMO_LOG = 20 * 1024 * 1024
+
+# Límites (segundos) de los histogramas de Prometheus
+LIMITES = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_actual = contextvars.ContextVar("pqrsdf_traza", default=None)
+
+
+class Traza:
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.inicio = time.time()
+        self.segundos = None
+        self.tramos = []
+
+    def agregar(self, nombre, segundos, datos):
+        # list.append es atómico: los hilos del despachador escriben aquí a la vez
+        self.tramos.append(dict(
+            {"tramo": nombre, "segundos": segundos},
+            **{clave: valor for clave, valor in datos.items() if valor is not None}
+        ))
+
+    def como_dict(self):
+        return {
+            "inicio": datetime.fromtimestamp(self.inicio).isoformat(timespec="milliseconds"),
+            "traza": self.nombre,
+            "segundos": self.segundos,
+            "pid": os.getpid(),
+            "tramos": self.tramos
+        }
+
+
+def traza_actual():
+    return _actual.get()
+
+
+@contextmanager
+def tramo(nombre, **datos):
+    # datos: filas, bytes u otros conteos; se pueden completar dentro del bloque
+    traza = _actual.get()
+    if traza is None:
+        yield datos
+        return
+
+    inicio = time.perf_counter()
+    try:
+        yield datos
+    finally:
+        traza.agregar(nombre, time.perf_counter() - inicio, datos)
+
+
+@contextmanager
+def trazar(nombre, destino=None):
+    traza = Traza(nombre)
+    token = _actual.set(traza)
+    inicio = time.perf_counter()
+    try:
+        yield traza
+    finally:
+        traza.segundos = time.perf_counter() - inicio
+        _actual.reset(token)
+        (destino or registro()).guardar(traza)
+
+
+def en_traza(traza, funcion):
+    # Para hilos de un pool: el contexto del hilo que llama no se hereda solo
+    def envoltura(*args, **kwargs):
+        token = _actual.set(traza)
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            _actual.reset(token)
+    return envoltura
+
+
+# ==================================================
+# REGISTRO (memoria + JSON lines + Prometheus)
+# ==================================================
+class Registro:
+
+    def __init__(self, ruta_log=RUTA_TIEMPOS, ruta_prometheus=None, en_memoria=TRAZAS_EN_MEMORIA):
+        self.ruta_log = ruta_log
+        self.ruta_prometheus = ruta_prometheus
+        self.trazas = deque(maxlen=en_memoria)
+
+        # Histogramas acumulados desde que arrancó el proceso:
+        # (métrica, etiquetas) -> [conteos por límite, suma, total]
+        self._histogramas = {}
+        self._lock = threading.Lock()
+
+    def ultimas(self, n):
+        with self._lock:
+            return list(self.trazas)[-n:]
+
+    def guardar(self, traza):
+        with self._lock:
+            self.trazas.append(traza)
+            self._observar("pqrsdf_traza_segundos", (("traza", traza.nombre),), traza.segundos)
+            for t in traza.tramos:
+                self._observar(
+                    "pqrsdf_tramo_segundos",
+                    (("traza", traza.nombre), ("tramo", t["tramo"])),
+                    t["segundos"]
+                )
+
+            try:
+                if self.ruta_log:
+                    self._escribir_log(traza)
+                if self.ruta_prometheus:
+                    self._escribir_prometheus()
+            except OSError:
+                # La medición nunca debe tumbar la app
+                pass
+
+    def _observar(self, metrica, etiquetas, segundos):
+        conteos, suma, total = self._histogramas.get((metrica, etiquetas), ([0] * len(LIMITES), 0.0, 0))
+        conteos = [c + (segundos <= limite) for c, limite in zip(conteos, LIMITES)]
+        self._histogramas[(metrica, etiquetas)] = (conteos, suma + segundos, total + 1)
+
+    def _escribir_log(self, traza):
+        carpeta = os.path.dirname(self.ruta_log)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        if os.path.exists(self.ruta_log) and os.path.getsize(self.ruta_log) > TAMANO_MAXIMO_LOG:
+            os.replace(self.ruta_log, self.ruta_log + ".1")
+        with open(self.ruta_log, "a", encoding="utf-8") as f:
+            f.write(json.dumps(traza.como_dict(), ensure_ascii=False) + "\n")
+
+    def _escribir_prometheus(self):
+        lineas = []
+        for metrica, ayuda in [
+            ("pqrsdf_traza_segundos", "Duración de cada rerun / recarga / envío"),
+            ("pqrsdf_tramo_segundos", "Duración de cada tramo medido"),
+        ]:
+            lineas += [f"# HELP {metrica} {ayuda}", f"# TYPE {metrica} histogram"]
+            for (nombre, etiquetas), (conteos, suma, total) in sorted(self._histogramas.items()):
+                if nombre != metrica:
+                    continue
+                base = ",".join(f'{clave}="{_escapar_etiqueta(valor)}"' for clave, valor in etiquetas)
+                for limite, conteo in zip(LIMITES, conteos):
+                    lineas.append(f'{metrica}_bucket{{{base},le="{limite}"}} {conteo}')
+                lineas.append(f'{metrica}_bucket{{{base},le="+Inf"}} {total}')
+                lineas.append(f"{metrica}_sum{{{base}}} {suma}")
+                lineas.append(f"{metrica}_count{{{base}}} {total}")
+
+        # Temporal + rename: el recolector nunca lee un archivo a medias
+        carpeta = os.path.dirname(self.ruta_prometheus)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        temporal = f"{self.ruta_prometheus}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            f.write("\n".join(lineas) + "\n")
+        os.replace(temporal, self.ruta_prometheus)
+
+
+def _escapar_etiqueta(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_registro = None
+_lock_registro = threading.Lock()
+
+
+def registro():
+    # Uno por proceso, compartido entre sesiones
+    global _registro
+    with _lock_registro:
+        if _registro is None:
+            _registro = Registro(
+                ruta_log=os.environ.get("PQRSDF_TIEMPOS", RUTA_TIEMPOS),
+                ruta_prometheus=os.environ.get("PQRSDF_PROMETHEUS") or None
+            )
+        return _registro
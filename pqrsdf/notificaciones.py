@@ -0,0 +1,200 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from pqrsdf.correo import construir_mensaje, filas_html
+from pqrsdf.envio import Mensaje
+from pqrsdf.medicion import tramo
+from pqrsdf.preparacion import columnas_originales
+
+# ==================================================
+# NOTIFICACIONES
+# ==================================================
+# Arma un correo por (área, dependencia) con los casos en proceso. Lo usan
+# la página de Notificaciones y `python -m pqrsdf notify`; no depende de
+# Streamlit.
+
+COPIAS = [
+    "cristian.upegui@urosario.edu.co",
+    "sandrapa.guzman@urosario.edu.co",
+    "yesid.garzon@urosario.edu.co",
+    "oportunidadesdemejora@urosario.edu.co"
+]
+
+RUTA_BITACORA = ".cache/notificaciones.sqlite"
+
+# Columnas de seguimiento que se escriben de vuelta en la hoja
+COLUMNA_NOTIFICADO = "Última notificación"
+COLUMNA_NOTIFICADO_A = "Notificado a"
+COLUMNA_VENCIDO = "Vencido"
+
+
+@dataclass
+class Notificacion:
+    area: str
+    dependencia: object
+    mensaje: Mensaje
+    # num caso de cada caso incluido en el correo
+    casos: list = field(default_factory=list)
+    huella: str = ""
+    # responsables del área (sin las copias fijas)
+    para: list = field(default_factory=list)
+    # por caso, en el mismo orden que `casos`: ¿ya pasó el vencimiento?
+    vencidos: list = field(default_factory=list)
+
+
+def huella_casos(casos):
+    # Mismo conjunto de casos -> misma huella, sin importar el orden
+    return hashlib.sha1("\n".join(sorted(map(str, casos))).encode()).hexdigest()[:16]
+
+
+def construir_notificaciones(df, sla, responsables, exportador, firma, remitente, hoy):
+    with tramo("notificaciones.armado") as t:
+        notificaciones = _construir(df, sla, responsables, exportador, firma, remitente, hoy)
+        t["filas"] = sum(len(n.casos) for n in notificaciones)
+        t["mensajes"] = len(notificaciones)
+        return notificaciones
+
+
+def _construir(df, sla, responsables, exportador, firma, remitente, hoy):
+    df_notif = df[~df['is_closed']].copy()
+    if df_notif.empty:
+        return []
+
+    sla = sla.loc[df_notif.index]
+    df_notif['Vencimiento'] = sla['Vencimiento']
+    df_notif['Dias_restantes'] = sla['Dias_restantes']
+
+    filas = filas_html(df_notif)
+    casos = (
+        df_notif['num caso'].astype("string").fillna("")
+        if 'num caso' in df_notif.columns
+        else pd.Series(df_notif.index.astype(str), index=df_notif.index)
+    )
+
+    notificaciones = []
+
+    # Un correo por (área, dependencia), en una sola pasada
+    for (area, dependencia), df_grupo in df_notif.groupby(
+        ['area_clave', 'dependencia_clave'], observed=True, dropna=False
+    ):
+
+        if pd.isna(area):
+            continue
+
+        dependencia = None if pd.isna(dependencia) else dependencia
+        lista_responsables, _ = responsables.buscar(area, dependencia)
+
+        titulo = area if dependencia in (None, area) else f"{area} - {dependencia}"
+
+        # Adjunto en caché por versión de datos (ver pqrsdf/exportacion.py)
+        ruta_adjunto = exportador.archivo(
+            columnas_originales(df_grupo),
+            ("notificacion", pd.Timestamp(hoy).date(), area, dependencia)
+        )
+        with open(ruta_adjunto, "rb") as f:
+            adjunto = f.read()
+
+        msg = construir_mensaje(
+            titulo,
+            filas.loc[df_grupo.index],
+            remitente,
+            lista_responsables,
+            firma,
+            adjunto=(f"PQRSDF_{titulo.title()}.xlsx", adjunto)
+        )
+
+        destinatarios = list(dict.fromkeys(lista_responsables + COPIAS))
+        casos_grupo = casos.loc[df_grupo.index].tolist()
+
+        notificaciones.append(Notificacion(
+            area=area,
+            dependencia=dependencia,
+            mensaje=Mensaje(titulo, remitente, destinatarios, msg),
+            casos=casos_grupo,
+            huella=huella_casos(casos_grupo),
+            para=lista_responsables,
+            vencidos=(df_grupo['Dias_restantes'] < 0).tolist()
+        ))
+
+    return notificaciones
+
+
+def marcas_seguimiento(notificaciones, entregas, momento):
+    # (num caso, valores) de cada caso cuyo correo sí salió; van a la cola
+    # de escritura (pqrsdf/escritura.py)
+    fecha = pd.Timestamp(momento).strftime("%Y-%m-%d %H:%M")
+
+    for notificacion, entrega in zip(notificaciones, entregas):
+        if not entrega.enviado:
+            continue
+        para = ", ".join(notificacion.para)
+        for caso, vencido in zip(notificacion.casos, notificacion.vencidos):
+            yield caso, {
+                COLUMNA_NOTIFICADO: fecha,
+                COLUMNA_NOTIFICADO_A: para,
+                COLUMNA_VENCIDO: "Sí" if vencido else "No"
+            }
+
+
+# ==================================================
+# BITÁCORA DE ENVÍOS (SQLite)
+# ==================================================
+# Clave: (área/dependencia, huella del conjunto de casos, fecha). Si la
+# misma notificación ya se entregó hoy, una nueva ejecución la omite.
+
+class Bitacora:
+
+    def __init__(self, ruta=RUTA_BITACORA):
+        self.ruta = ruta
+        carpeta = os.path.dirname(ruta)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+
+        with closing(sqlite3.connect(self.ruta)) as con, con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS envios ("
+                "clave TEXT, huella TEXT, fecha TEXT, destinatarios TEXT, enviado_en REAL, "
+                "PRIMARY KEY (clave, huella, fecha))"
+            )
+
+    def entregadas(self, fecha):
+        with closing(sqlite3.connect(self.ruta)) as con:
+            return {
+                (clave, huella)
+                for clave, huella in con.execute(
+                    "SELECT clave, huella FROM envios WHERE fecha = ?", (str(fecha),)
+                )
+            }
+
+    def pendientes(self, notificaciones, fecha):
+        entregadas = self.entregadas(fecha)
+        return [n for n in notificaciones if (n.mensaje.clave, n.huella) not in entregadas]
+
+    def registrar(self, notificaciones, entregas, fecha):
+        # Solo se anotan las que efectivamente salieron
+        registros = [
+            (n.mensaje.clave, n.huella, str(fecha), ", ".join(e.destinatarios), time.time())
+            for n, e in zip(notificaciones, entregas)
+            if e.enviado
+        ]
+        with closing(sqlite3.connect(self.ruta)) as con, con:
+            con.executemany("INSERT OR REPLACE INTO envios VALUES (?, ?, ?, ?, ?)", registros)
+        return len(registros)
+
+
+def guardar_eml(notificaciones, carpeta):
+    os.makedirs(carpeta, exist_ok=True)
+    rutas = []
+    for n in notificaciones:
+        nombre = "".join(c if c.isalnum() or c in "-_" else "_" for c in n.mensaje.clave)
+        ruta = os.path.join(carpeta, f"{nombre}_{n.huella}.eml")
+        with open(ruta, "wb") as f:
+            f.write(n.mensaje.contenido.as_bytes())
+        rutas.append(ruta)
+    return rutas
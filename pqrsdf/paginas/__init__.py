@@ -0,0 +1,13 @@
+# ==================================================
+# PÁGINAS DE LA APP
+# ==================================================
+# Cada página vive en su propio módulo y se importa solo cuando se abre:
+# plotly, email/smtplib y xlsxwriter no se cargan en páginas que no los usan.
+
+PAGINAS = {
+    "📌 Seguimiento Diario": "pqrsdf.paginas.seguimiento",
+    "🎯 Indicador por Área": "pqrsdf.paginas.indicador",
+    "🔎 Búsqueda de Caso": "pqrsdf.paginas.busqueda",
+    "📥 Exportación mensual": "pqrsdf.paginas.exportacion",
+    "📧 Notificaciones": "pqrsdf.paginas.notificaciones",
+}
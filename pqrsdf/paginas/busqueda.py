@@ -0,0 +1,65 @@
+import streamlit as st
+
+from pqrsdf.busqueda import IndiceCasos, separar_numeros
+from pqrsdf.medicion import tramo
+from pqrsdf.preparacion import columnas_originales
+
+# ==================================================
+# 🔎 BÚSQUEDA
+# ==================================================
+
+# Índice de búsqueda (una vez por versión de datos)
+@st.cache_resource(max_entries=2)
+def indice_casos(_df, version):
+    with tramo("busqueda.indice", filas=len(_df)):
+        return IndiceCasos(_df)
+
+
+def mostrar(df, version):
+
+    st.markdown("## 🔎 Buscar Caso")
+
+    indice = indice_casos(df, version)
+
+    modo = st.radio(
+        "Buscar por",
+        ["Número(s) de caso", "Prefijo", "Texto (solicitante, descripción...)"],
+        horizontal=True
+    )
+
+    if modo == "Número(s) de caso":
+        numeros = separar_numeros(st.text_area("Números de caso (uno o varios, separados por coma o salto de línea)"))
+
+        if numeros:
+            with tramo("busqueda.numeros", consultas=len(numeros)):
+                resultado, faltantes = indice.buscar_numeros(numeros)
+            if resultado.empty:
+                st.warning("No se encontró el caso.")
+            else:
+                st.dataframe(columnas_originales(resultado), use_container_width=True)
+            if faltantes and not resultado.empty:
+                st.warning(f"No se encontraron {len(faltantes)} casos: {', '.join(faltantes)}")
+
+    elif modo == "Prefijo":
+        prefijo = st.text_input("Inicio del número de caso")
+
+        if prefijo.strip():
+            with tramo("busqueda.prefijo"):
+                resultado, total = indice.buscar_prefijo(prefijo)
+            if resultado.empty:
+                st.warning("No se encontró el caso.")
+            else:
+                st.caption(f"{total} casos encontrados (se muestran {len(resultado)})")
+                st.dataframe(columnas_originales(resultado), use_container_width=True)
+
+    else:
+        consulta = st.text_input("Texto a buscar")
+
+        if consulta.strip():
+            with tramo("busqueda.texto"):
+                resultado, total = indice.buscar_texto(consulta)
+            if resultado.empty:
+                st.warning("No se encontró el caso.")
+            else:
+                st.caption(f"{total} casos encontrados (se muestran {len(resultado)})")
+                st.dataframe(columnas_originales(resultado), use_container_width=True)
@@ -0,0 +1,39 @@
+import streamlit as st
+
+from pqrsdf.medicion import tramo
+from pqrsdf.preparacion import columnas_originales
+from pqrsdf.sla import calcular_sla
+
+# ==================================================
+# CACHÉS COMPARTIDAS ENTRE PÁGINAS
+# ==================================================
+
+# SLA en días hábiles (una vez por versión de datos y día)
+@st.cache_resource(max_entries=2)
+def sla_del_dia(_df, version, hoy):
+    with tramo("sla", filas=len(_df)):
+        return calcular_sla(_df, hoy)
+
+
+# Exportaciones en caché (por versión de datos); xlsxwriter se carga aquí
+@st.cache_resource(max_entries=2)
+def exportador_datos(_df, version):
+    from pqrsdf.exportacion import Exportador, huella_datos
+
+    return Exportador(huella_datos(columnas_originales(_df)))
+
+
+# Hoja de casos (gspread se importa al conectar)
+@st.cache_resource
+def hoja_casos(sheets_id):
+    from pqrsdf.sincronizacion import NOMBRE_HOJA, conectar_google
+
+    return conectar_google().open_by_key(sheets_id).worksheet(NOMBRE_HOJA)
+
+
+# Cola de escritura en la hoja (una por proceso, ver pqrsdf/escritura.py)
+@st.cache_resource
+def cola_escritura(sheets_id):
+    from pqrsdf.escritura import ColaEscritura
+
+    return ColaEscritura(hoja_casos(sheets_id))
@@ -0,0 +1,67 @@
+import os
+
+import streamlit as st
+
+from pqrsdf.exportacion import FORMATOS, nombre_archivo
+from pqrsdf.paginas.comun import exportador_datos
+from pqrsdf.preparacion import columnas_originales
+
+# ==================================================
+# 📥 EXPORTACIÓN
+# ==================================================
+
+def mostrar(df, version):
+
+    st.markdown("## 📥 Exportación por Área y Año")
+
+    area = st.selectbox("Área", sorted(df['Area principal'].dropna().unique()))
+    anio = st.selectbox("Año", sorted(df['AÑO'].dropna().unique()))
+    formato = st.radio("Formato", list(FORMATOS), horizontal=True)
+
+    exportador = exportador_datos(df, version)
+
+    df_exp = df[
+        (df['Area principal'] == area) &
+        (df['AÑO'] == anio)
+    ]
+
+    if df_exp.empty:
+        st.warning("No hay datos.")
+    else:
+        # Mismo archivo que usa la exportación masiva: se genera una sola vez
+        ruta = exportador.archivo(columnas_originales(df_exp), ("area", area, anio), formato)
+
+        with open(ruta, "rb") as f:
+            st.download_button(
+                "📥 Descargar archivo",
+                f.read(),
+                file_name=nombre_archivo(area, anio, formato)
+            )
+
+    # ==============================
+    # EXPORTACIÓN MASIVA
+    # ==============================
+    st.markdown("### 📦 Todas las áreas")
+
+    modo = st.radio(
+        "Modo",
+        ["ZIP con un archivo por área", "Un libro Excel con una hoja por área"],
+        horizontal=True
+    )
+
+    if st.button("Generar exportación masiva"):
+        with st.spinner("Generando archivos..."):
+            if modo.startswith("ZIP"):
+                ruta = exportador.zip_por_area(columnas_originales(df), anio, formato)
+                nombre = f"PQRSDF_areas_{anio}_{formato.lower()}.zip"
+            else:
+                ruta = exportador.libro_por_area(columnas_originales(df), anio)
+                nombre = f"PQRSDF_areas_{anio}.xlsx"
+
+        st.session_state["exportacion_masiva"] = (ruta, nombre)
+
+    if "exportacion_masiva" in st.session_state:
+        ruta, nombre = st.session_state["exportacion_masiva"]
+        if os.path.exists(ruta):
+            with open(ruta, "rb") as f:
+                st.download_button("📦 Descargar exportación masiva", f.read(), file_name=nombre)
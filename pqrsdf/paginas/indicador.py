@@ -0,0 +1,95 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from pqrsdf.cubo import CATEGORIAS_INDICADOR, construir_cubo, resumir
+from pqrsdf.medicion import tramo
+from pqrsdf.paginas.comun import sla_del_dia
+
+# ==================================================
+# 🎯 INDICADOR POR ÁREA
+# ==================================================
+
+# Cubo SLA (una vez por versión de datos y día)
+@st.cache_resource(max_entries=2)
+def cubo_sla(_df, version, hoy):
+    dias_restantes = sla_del_dia(_df, version, hoy)['Dias_restantes']
+    with tramo("indicador.cubo", filas=len(_df)):
+        return construir_cubo(_df, dias_restantes)
+
+
+def mostrar(df, version):
+
+    st.markdown("## 🎯 Indicador de Cumplimiento SLA")
+
+    anio = st.selectbox("Año", sorted(df['AÑO'].dropna().unique()))
+
+    cubo = cubo_sla(df, version, pd.Timestamp.today().normalize())
+
+    with tramo("indicador.resumen", filas=len(cubo)):
+        resumen = resumir(
+            cubo,
+            'Area principal',
+            anios=[anio],
+            categorias=CATEGORIAS_INDICADOR
+        )
+
+    if resumen.empty:
+        st.warning("No hay registros.")
+        st.stop()
+
+    st.dataframe(resumen, use_container_width=True)
+
+    tab_tendencia, tab_anios, tab_categoria = st.tabs([
+        "📈 Tendencia mensual",
+        "📊 Comparación entre años",
+        "🔍 Detalle por categoría"
+    ])
+
+    with tab_tendencia:
+        areas_tendencia = st.multiselect("Áreas", sorted(resumen['Area principal']))
+
+        tendencia = resumir(
+            cubo,
+            ['Area principal', 'Mes'] if areas_tendencia else 'Mes',
+            anios=[anio],
+            areas=areas_tendencia or None,
+            categorias=CATEGORIAS_INDICADOR
+        )
+
+        fig = px.line(
+            tendencia,
+            x='Mes',
+            y='Indicador (%)',
+            color='Area principal' if areas_tendencia else None,
+            markers=True
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with tab_anios:
+        comparacion = resumir(
+            cubo,
+            ['AÑO', 'Area principal'],
+            categorias=CATEGORIAS_INDICADOR
+        )
+        comparacion['AÑO'] = comparacion['AÑO'].astype(str)
+
+        st.dataframe(
+            comparacion.pivot(index='Area principal', columns='AÑO', values='Indicador (%)'),
+            use_container_width=True
+        )
+
+        fig = px.bar(
+            comparacion,
+            x='Area principal',
+            y='Indicador (%)',
+            color='AÑO',
+            barmode='group'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with tab_categoria:
+        area_detalle = st.selectbox("Área", sorted(resumen['Area principal']))
+
+        detalle = resumir(cubo, 'Categoría', anios=[anio], areas=[area_detalle])
+        st.dataframe(detalle, use_container_width=True)
@@ -0,0 +1,127 @@
+import pandas as pd
+import streamlit as st
+
+from pqrsdf.correo import cargar_firma
+from pqrsdf.envio import Despachador
+from pqrsdf.notificaciones import Bitacora, construir_notificaciones, marcas_seguimiento
+from pqrsdf.paginas.comun import cola_escritura, exportador_datos, sla_del_dia
+from pqrsdf.responsables import indice_responsables, reporte_enrutamiento
+
+# ==================================================
+# 📧 NOTIFICACIONES
+# ==================================================
+
+# Firma de correo (se lee una vez por proceso)
+@st.cache_resource
+def firma_correo():
+    return cargar_firma()
+
+
+def mostrar(df, version):
+
+    st.markdown("## 📧 Envío Manual de Notificaciones")
+
+    # ==============================
+    # CARGAR RESPONSABLES (solo se relee si cambia el archivo)
+    # ==============================
+    try:
+        responsables = indice_responsables()
+    except Exception as e:
+        st.error(f"No se pudo cargar responsables.xlsx: {e}")
+        st.stop()
+
+    grupos_abiertos = (
+        df[~df['is_closed']]
+        .groupby(['area_clave', 'dependencia_clave'], observed=True, dropna=False)
+        .size()
+        .index
+    )
+
+    with st.expander("🧭 Enrutamiento de notificaciones"):
+        sin_match = reporte_enrutamiento(responsables, grupos_abiertos)
+        st.caption(f"{len(grupos_abiertos) - len(sin_match)} de {len(grupos_abiertos)} combinaciones área/dependencia tienen responsable propio.")
+        st.dataframe(sin_match, use_container_width=True)
+
+        if responsables.sin_responsable:
+            st.warning("Filas de responsables.xlsx sin ningún correo válido:")
+            st.dataframe(
+                pd.DataFrame(responsables.sin_responsable, columns=["Área", "Dependencia"]),
+                use_container_width=True
+            )
+
+        if responsables.malformados:
+            st.warning("Direcciones inválidas en responsables.xlsx:")
+            st.dataframe(
+                pd.DataFrame(responsables.malformados, columns=["Área", "Dependencia", "Valor"]),
+                use_container_width=True
+            )
+
+    if st.button("📨 Enviar Notificaciones"):
+
+        hoy = pd.Timestamp.today().normalize()
+
+        # ==============================
+        # ARMAR CORREOS (mismo flujo que `python -m pqrsdf notify`)
+        # ==============================
+        notificaciones = construir_notificaciones(
+            df,
+            sla_del_dia(df, version, hoy),
+            responsables,
+            exportador_datos(df, version),
+            firma_correo(),
+            st.secrets["EMAIL_USER"],
+            hoy
+        )
+
+        if not notificaciones:
+            st.warning("No hay casos en proceso.")
+            st.stop()
+
+        mensajes = [n.mensaje for n in notificaciones]
+
+        # ==============================
+        # ENVIAR (conexiones reutilizadas, en paralelo, con reintentos)
+        # ==============================
+        despachador = Despachador(
+            st.secrets["EMAIL_USER"],
+            st.secrets["EMAIL_PASSWORD"]
+        )
+
+        with st.spinner(f"Enviando {len(mensajes)} notificaciones..."):
+            entregas = despachador.enviar(mensajes)
+
+        # Lo enviado queda en la bitácora: el envío programado no lo repite hoy
+        enviados = Bitacora().registrar(notificaciones, entregas, hoy.date())
+
+        for entrega in entregas:
+            if not entrega.enviado:
+                st.error(f"Error enviando correo para {entrega.clave}: {entrega.error}")
+
+        st.dataframe(
+            pd.DataFrame([{
+                "Área / Dependencia": e.clave.title(),
+                "Enviado": e.enviado,
+                "Intentos": e.intentos,
+                "Destinatarios": ", ".join(e.destinatarios),
+                "Rechazados": ", ".join(e.rechazados),
+                "Error": e.error
+            } for e in entregas]),
+            use_container_width=True
+        )
+
+        st.success(f"✅ Se enviaron {enviados} notificaciones.")
+
+        # ==============================
+        # REGISTRAR EN LA HOJA (una sola solicitud batch_update)
+        # ==============================
+        cola = cola_escritura(st.secrets["GOOGLE_SHEETS_ID"])
+        for caso, valores in marcas_seguimiento(notificaciones, entregas, pd.Timestamp.now()):
+            cola.encolar(caso, valores)
+
+        try:
+            with st.spinner("Registrando notificaciones en la hoja..."):
+                vaciado = cola.vaciar()
+            st.caption(f"Hoja actualizada: {vaciado.celdas} celdas de {vaciado.casos} casos.")
+        except Exception as e:
+            # Lo pendiente queda en la cola y sale con el próximo envío
+            st.warning(f"No se pudo escribir en la hoja ({cola.pendientes} casos pendientes): {e}")
@@ -0,0 +1,96 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from pqrsdf.medicion import tramo
+from pqrsdf.paginas.comun import sla_del_dia
+from pqrsdf.seguimiento import ESTADOS, clasificar, filtrar, resumen
+
+# ==================================================
+# 📌 SEGUIMIENTO DIARIO
+# ==================================================
+
+# Estado SLA de cada caso (una pasada por versión de datos y día)
+@st.cache_resource(max_entries=2)
+def estados_del_dia(_df, version, hoy):
+    dias_restantes = sla_del_dia(_df, version, hoy)['Dias_restantes']
+    with tramo("seguimiento.clasificar", filas=len(_df)):
+        return clasificar(_df, dias_restantes)
+
+
+# Métricas, envejecimiento y lista en riesgo por (año, área, día): cambiar
+# de filtro y volver no recalcula
+@st.cache_resource(max_entries=64)
+def seguimiento_filtrado(_df, version, anio, area, hoy):
+    estado = estados_del_dia(_df, version, hoy)
+    dias_restantes = sla_del_dia(_df, version, hoy)['Dias_restantes']
+    with tramo("seguimiento.resumen") as t:
+        df_seg = filtrar(_df, anio, area)
+        t["filas"] = len(df_seg)
+        return resumen(df_seg, estado, dias_restantes)
+
+
+def mostrar(df, version):
+
+    st.markdown("## 📌 Seguimiento de Casos")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        area = st.selectbox("Área", ["Todas"] + sorted(df['Area principal'].dropna().unique()))
+
+    with col2:
+        anio = st.selectbox("Año", sorted(df['AÑO'].dropna().unique()))
+
+    hoy = pd.Timestamp.today().normalize()
+    seguimiento = seguimiento_filtrado(df, version, anio, area, hoy)
+
+    for columna, (nombre, valor) in zip(st.columns(6), seguimiento.metricas.items()):
+        columna.metric(nombre, valor)
+
+    st.caption("Vencimientos contados en días hábiles (sin fines de semana ni festivos de Colombia).")
+
+    # ==============================
+    # ENVEJECIMIENTO DE CASOS ABIERTOS POR ÁREA
+    # ==============================
+    st.markdown("### ⏳ Envejecimiento por área")
+
+    if seguimiento.envejecimiento.empty:
+        st.info("No hay casos en proceso.")
+    else:
+        barras = (
+            seguimiento.envejecimiento
+            .rename_axis(index="Area principal", columns="Estado SLA")
+            .stack()
+            .rename("Casos")
+            .reset_index()
+        )
+        fig = px.bar(
+            barras,
+            x='Area principal',
+            y='Casos',
+            color='Estado SLA',
+            category_orders={'Estado SLA': ESTADOS[1:]},
+            color_discrete_sequence=["#2ca02c", "#ffbf00", "#ff7f0e", "#d62728", "#7f0000"]
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    # ==============================
+    # CASOS EN RIESGO (ordenable por cualquier columna)
+    # ==============================
+    st.markdown("### 🚨 Casos en riesgo")
+
+    en_riesgo = seguimiento.en_riesgo
+    if en_riesgo.empty:
+        st.success("No hay casos por vencer ni vencidos.")
+    else:
+        estados = st.multiselect(
+            "Estado SLA",
+            list(en_riesgo['Estado SLA'].cat.categories[2:]),
+            default=list(en_riesgo['Estado SLA'].cat.categories[2:])
+        )
+        st.dataframe(
+            en_riesgo[en_riesgo['Estado SLA'].isin(estados)],
+            hide_index=True,
+            use_container_width=True
+        )
@@ -0,0 +1,48 @@
+import pandas as pd
+import streamlit as st
+
+# ==================================================
+# ⏱️ PANEL DE TIEMPOS (ADMINISTRADORES)
+# ==================================================
+# Muestra las últimas trazas del proceso (ver pqrsdf/medicion.py): una por
+# rerun de cualquier sesión, más las recargas de datos en segundo plano.
+
+def panel_tiempos(registro):
+    with st.sidebar.expander("⏱️ Tiempos"):
+        n = st.slider("Últimos reruns", 5, 50, 10)
+        trazas = registro.ultimas(n)
+
+        if not trazas:
+            st.caption("Todavía no hay reruns medidos.")
+            return
+
+        resumen = pd.DataFrame([{
+            "Inicio": pd.Timestamp.fromtimestamp(t.inicio).strftime("%H:%M:%S"),
+            "Traza": t.nombre,
+            "Total (ms)": round(t.segundos * 1000),
+            # El tramo más lento de cada rerun
+            "Más lento": max(t.tramos, key=lambda x: x["segundos"])["tramo"] if t.tramos else "",
+        } for t in reversed(trazas)])
+        st.dataframe(resumen, hide_index=True, use_container_width=True)
+
+        percentiles = (
+            resumen.groupby("Traza")["Total (ms)"]
+            .quantile([0.5, 0.95])
+            .unstack()
+            .rename(columns={0.5: "p50 (ms)", 0.95: "p95 (ms)"})
+        )
+        st.dataframe(percentiles.round(), use_container_width=True)
+
+        elegida = st.selectbox(
+            "Detalle",
+            range(len(trazas)),
+            format_func=lambda i: f"{resumen['Inicio'][i]} · {resumen['Traza'][i]}"
+        )
+        tramos = pd.DataFrame(list(reversed(trazas))[elegida].tramos)
+        if not tramos.empty:
+            tramos["segundos"] = (tramos["segundos"] * 1000).round(1)
+            st.dataframe(
+                tramos.rename(columns={"tramo": "Tramo", "segundos": "ms"}),
+                hide_index=True,
+                use_container_width=True
+            )
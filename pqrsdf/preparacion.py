@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+# ==================================================
+# PREPARACIÓN DEL DATASET
+# ==================================================
+# Se ejecuta una vez por versión de datos (en el hilo de refresco) y deja
+# un frame tipado que todas las páginas leen sin volver a normalizar.
+# Con copy-on-write (pandas >= 3) los filtros de cada página no tocan el
+# frame compartido.
+
+COLUMNAS_CATEGORICAS = ["Estado", "Categoría", "SLA", "Area principal", "Dependencia", "AÑO"]
+
+# Columnas agregadas aquí; no se exportan ni se envían en los adjuntos
+COLUMNAS_DERIVADAS = ["area_clave", "dependencia_clave", "is_closed", "sla_ok", "sla_breached"]
+
+
+def preparar(df):
+    df = df.copy()
+    df.columns = df.columns.str.strip()
+
+    df['Estado'] = df['Estado'].astype(str).str.lower().str.strip()
+    df['Categoría'] = df['Categoría'].astype(str).str.strip()
+    df['SLA'] = df['SLA'].astype(str).str.lower().str.strip()
+    df['Fecha cierre'] = pd.to_datetime(df['Fecha cierre'], errors='coerce')
+
+    for col in ['Area principal', 'Dependencia']:
+        if col in df.columns:
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str).str.strip())
+
+    for col in COLUMNAS_CATEGORICAS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    # Claves en minúscula para cruzar con responsables.xlsx
+    df['area_clave'] = _minusculas(df['Area principal'])
+    df['dependencia_clave'] = (
+        _minusculas(df['Dependencia']) if 'Dependencia' in df.columns
+        else pd.Categorical([None] * len(df))
+    )
+
+    df['is_closed'] = df['Estado'] == "cerrado"
+    df['sla_ok'] = _contiene(df['SLA'], "si")
+    df['sla_breached'] = _contiene(df['SLA'], "no")
+
+    return df
+
+
+def columnas_originales(df):
+    return df.drop(columns=[c for c in COLUMNAS_DERIVADAS if c in df.columns])
+
+
+def _minusculas(serie):
+    # Se transforman las categorías, no cada fila
+    minusculas = serie.cat.categories.astype(str).str.lower()
+    if minusculas.is_unique:
+        return serie.cat.rename_categories(minusculas)
+    return serie.astype("string").str.lower().astype("category")
+
+
+def _contiene(serie, texto):
+    categorias = np.asarray(serie.cat.categories.astype(str).str.contains(texto), dtype=bool)
+    codigos = serie.cat.codes.to_numpy()
+    if not len(categorias):
+        return pd.Series(False, index=serie.index)
+    return pd.Series((codigos >= 0) & categorias[codigos], index=serie.index)
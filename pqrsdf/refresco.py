@@ -0,0 +1,86 @@
+import threading
+import time
+
+# ==================================================
+# REFRESCO EN SEGUNDO PLANO
+# ==================================================
+# Un único hilo reconstruye el dataset cada `intervalo` segundos o cuando
+# se solicita. Los lectores siempre reciben la última versión buena sin
+# esperar; solo la primera carga del proceso bloquea. El hilo arranca con
+# el primer uso (iniciar/obtener), no al crear el objeto.
+#
+# `cargar(vigente)` recibe el df publicado (None en la primera carga) y lo
+# devuelve tal cual si los datos no cambiaron: entonces solo se actualiza
+# el momento de carga y la versión se conserva, con lo que las cachés por
+# versión de las páginas siguen sirviendo.
+
+class Refrescador:
+
+    def __init__(self, cargar, intervalo=300):
+        self._cargar = cargar
+        self.intervalo = intervalo
+
+        # (df, momento de carga, número de versión): se reemplaza de una sola vez
+        self._estado = (None, None, 0)
+        self.error = None
+        self.en_curso = False
+
+        self._pedido = threading.Event()
+        self._listo = threading.Event()
+        self._lock = threading.Lock()
+        self._hilo = None
+
+    def iniciar(self):
+        with self._lock:
+            if self._hilo is None:
+                self._hilo = threading.Thread(target=self._ciclo, name="pqrsdf-refresco", daemon=True)
+                self._hilo.start()
+
+    @property
+    def listo(self):
+        return self._listo.is_set()
+
+    def obtener(self):
+        # (df, versión) de una sola lectura del estado: si el hilo publica
+        # entre dos lecturas, las cachés guardarían el df viejo bajo la
+        # versión nueva
+        self.iniciar()
+        self._listo.wait()
+        df, _, version = self._estado
+        if df is None:
+            raise RuntimeError(f"No se pudieron cargar los datos: {self.error}")
+        return df, version
+
+    def antiguedad(self):
+        cargado = self._estado[1]
+        return None if cargado is None else time.time() - cargado
+
+    def solicitar(self):
+        # Varias solicitudes simultáneas se atienden con un solo refresco;
+        # antes del primer uso basta con arrancar (la primera carga ya lo es)
+        if self._hilo is None:
+            self.iniciar()
+        else:
+            self._pedido.set()
+
+    def _ciclo(self):
+        while True:
+            self._refrescar()
+            self._pedido.wait(timeout=self.intervalo)
+            self._pedido.clear()
+
+    def _refrescar(self):
+        self.en_curso = True
+        try:
+            vigente, _, version = self._estado
+            df = self._cargar(vigente)
+            if df is not vigente:
+                version += 1
+            self._estado = (df, time.time(), version)
+            self.error = None
+        except Exception as e:
+            # Se conserva la última versión buena
+            self.error = e
+        finally:
+            self.en_curso = False
+            self._listo.set()
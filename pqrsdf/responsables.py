@@ -0,0 +1,108 @@
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+# ==================================================
+# ÍNDICE DE RESPONSABLES
+# ==================================================
+# responsables.xlsx se lee una sola vez y se vuelve a leer solo cuando
+# cambia su fecha de modificación. El resultado es un dict
+# (area principal, dependencia) -> lista de correos ya validados.
+
+RUTA_RESPONSABLES = "responsables.xlsx"
+CORREO_POR_DEFECTO = "cristian.upegui@urosario.edu.co"
+
+SEPARADORES_CORREO = re.compile(r"\s*(?:,|;|//)\s*")
+PATRON_CORREO = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+@dataclass
+class IndiceResponsables:
+    destinatarios: dict = field(default_factory=dict)
+    # (area, dependencia, valor) de cada dirección que no parece un correo
+    malformados: list = field(default_factory=list)
+    # (area, dependencia) que existen en el archivo pero sin correos válidos
+    sin_responsable: list = field(default_factory=list)
+
+    def buscar(self, area, dependencia):
+        # 1. (área, dependencia)  2. fila principal del área (dependencia = área)
+        if (area, dependencia) in self.destinatarios:
+            return self.destinatarios[(area, dependencia)], "dependencia"
+        if (area, area) in self.destinatarios:
+            return self.destinatarios[(area, area)], "área"
+        return [CORREO_POR_DEFECTO], "por defecto"
+
+
+def _clave(valor):
+    return None if pd.isna(valor) else str(valor).strip().lower()
+
+
+def leer_responsables(ruta=RUTA_RESPONSABLES):
+    responsables_df = pd.read_excel(ruta)
+    responsables_df.columns = responsables_df.columns.str.strip().str.lower()
+
+    indice = IndiceResponsables()
+    # Pares del archivo en orden de aparición (dict como conjunto ordenado)
+    vistos = {}
+
+    for area, dependencia, responsable in zip(
+        responsables_df['area principal'].map(_clave),
+        responsables_df['dependencia'].map(_clave),
+        responsables_df['responsable']
+    ):
+        if area is None:
+            continue
+
+        vistos[(area, dependencia)] = None
+        correos = indice.destinatarios.get((area, dependencia), [])
+
+        if pd.notna(responsable):
+            for correo in SEPARADORES_CORREO.split(str(responsable).strip()):
+                if not correo:
+                    continue
+                if PATRON_CORREO.match(correo):
+                    if correo.lower() not in (c.lower() for c in correos):
+                        correos.append(correo)
+                else:
+                    indice.malformados.append((area, dependencia, correo))
+
+        if correos:
+            indice.destinatarios[(area, dependencia)] = correos
+
+    # Al final: un par puede recibir correos en una fila posterior
+    indice.sin_responsable = [par for par in vistos if par not in indice.destinatarios]
+
+    return indice
+
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def indice_responsables(ruta=RUTA_RESPONSABLES):
+    modificado = os.stat(ruta).st_mtime_ns
+
+    with _lock:
+        guardado = _cache.get(ruta)
+        if guardado is None or guardado[0] != modificado:
+            guardado = (modificado, leer_responsables(ruta))
+            _cache[ruta] = guardado
+        return guardado[1]
+
+
+def reporte_enrutamiento(indice, grupos):
+    # grupos: pares (area, dependencia) presentes en los casos a notificar
+    filas = []
+    for area, dependencia in grupos:
+        correos, origen = indice.buscar(area, dependencia)
+        if origen != "dependencia":
+            filas.append({
+                "Área": area,
+                "Dependencia": dependencia,
+                "Enviado a": ", ".join(correos),
+                "Origen": origen
+            })
+    return pd.DataFrame(filas, columns=["Área", "Dependencia", "Enviado a", "Origen"])
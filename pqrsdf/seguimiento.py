@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# ==================================================
+# SEGUIMIENTO DIARIO
+# ==================================================
+# Cálculos de la página de seguimiento, sin Streamlit (los usa también
+# benchmarks/bench_paginas.py).
+#
+# Cada caso cae en un solo estado, asignado en una pasada sobre los días
+# hábiles restantes; métricas, envejecimiento y lista en riesgo salen de
+# esa clasificación.
+
+CERRADO = "Cerrado"
+A_TIEMPO = "A tiempo"
+POR_VENCER = "Vence en ≤3 días"
+VENCIDO_1_5 = "Vencido 1–5 días"
+VENCIDO_6_15 = "Vencido 6–15 días"
+VENCIDO_MAS_15 = "Vencido >15 días"
+
+ESTADOS = [CERRADO, A_TIEMPO, POR_VENCER, VENCIDO_1_5, VENCIDO_6_15, VENCIDO_MAS_15]
+VENCIDOS = [VENCIDO_1_5, VENCIDO_6_15, VENCIDO_MAS_15]
+EN_RIESGO = [POR_VENCER] + VENCIDOS
+
+# Cortes sobre días restantes (np.digitize, intervalos [a, b)):
+#   < -15 | -15..-6 | -5..-1 | 0..3 | >= 4 (y sin fecha)
+_CORTES = [-15, -5, 0, 4]
+_ESTADO_POR_TRAMO = np.array([
+    ESTADOS.index(VENCIDO_MAS_15),
+    ESTADOS.index(VENCIDO_6_15),
+    ESTADOS.index(VENCIDO_1_5),
+    ESTADOS.index(POR_VENCER),
+    ESTADOS.index(A_TIEMPO),
+], dtype=np.int8)
+
+COLUMNAS_EN_RIESGO = ["num caso", "Area principal", "Dependencia", "Categoría", "Fecha cierre"]
+
+
+@dataclass
+class Seguimiento:
+    metricas: dict
+    # casos abiertos por área y estado (filas: área, columnas: estado)
+    envejecimiento: pd.DataFrame
+    # casos por vencer o vencidos, del más atrasado al menos atrasado
+    en_riesgo: pd.DataFrame
+
+
+def clasificar(df, dias_restantes):
+    # dias_restantes: días hábiles al vencimiento, alineado con df (NaN = sin fecha)
+    # Los casos abiertos sin fecha cuentan como "A tiempo", igual que antes
+    # (no sumaban ni en próximos a vencer ni en vencidos).
+    dias = np.asarray(dias_restantes, dtype=float)
+    codigos = _ESTADO_POR_TRAMO[np.digitize(dias, _CORTES)]
+    codigos[df['is_closed'].to_numpy(dtype=bool)] = ESTADOS.index(CERRADO)
+
+    return pd.Series(pd.Categorical.from_codes(codigos, ESTADOS), index=df.index, name="Estado SLA")
+
+
+def filtrar(df, anio, area="Todas"):
+    df_seg = df[df['AÑO'] == anio]
+    if area != "Todas":
+        df_seg = df_seg[df_seg['Area principal'] == area]
+    return df_seg
+
+
+def resumen(df_seg, estado, dias_restantes):
+    # estado y dias_restantes: de todo el conjunto; se alinean con df_seg
+    estado = estado.loc[df_seg.index]
+    conteo = np.bincount(estado.cat.codes.to_numpy(), minlength=len(ESTADOS))
+    por_estado = dict(zip(ESTADOS, conteo.tolist()))
+
+    metricas = {
+        "Total": len(df_seg),
+        "En Proceso": len(df_seg) - por_estado[CERRADO],
+        "Cerrados": por_estado[CERRADO],
+        "No Cumplen SLA": int(df_seg['sla_breached'].sum()),
+        "Próximos a Vencer": por_estado[POR_VENCER],
+        "🚨 Vencidos": sum(por_estado[e] for e in VENCIDOS),
+    }
+
+    abiertos = estado != CERRADO
+    envejecimiento = (
+        pd.crosstab(df_seg.loc[abiertos, 'Area principal'], estado[abiertos], dropna=False)
+        .reindex(columns=ESTADOS[1:], fill_value=0)
+    )
+    envejecimiento = envejecimiento[envejecimiento.sum(axis=1) > 0]
+
+    riesgo = estado.isin(EN_RIESGO)
+    en_riesgo = df_seg.loc[riesgo, [c for c in COLUMNAS_EN_RIESGO if c in df_seg.columns]].copy()
+    en_riesgo["Días restantes"] = dias_restantes.loc[en_riesgo.index].astype("Int64")
+    en_riesgo["Estado SLA"] = estado[riesgo]
+    en_riesgo = en_riesgo.sort_values("Días restantes", kind="stable")
+
+    return Seguimiento(metricas, envejecimiento, en_riesgo)
+
@@ -0,0 +1,346 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+import pandas as pd
+
+from pqrsdf.medicion import tramo
+
+# ==================================================
+# CONFIGURACIÓN
+# ==================================================
+COLUMNA_CLAVE = "num caso"
+COLUMNA_ESTADO = "Estado"
+
+# Cada cuánto se descarga la hoja completa aunque no haya indicios de cambio
+# (cubre ediciones en casos cerrados y filas borradas que no cambian el conteo)
+REVISION_COMPLETA_CADA = 24 * 60 * 60
+
+# Filas cerradas que se releen con tal de unir dos rangos en uno solo
+HUECO_MAXIMO = 20
+
+# Rangos por cada llamada a batch_get
+RANGOS_POR_LLAMADA = 100
+
+RUTA_SNAPSHOT = ".cache/pqrsdf.sqlite"
+RUTA_CREDENCIALES = "pqrsdf-485914-1eefe7b5cc14.json"
+NOMBRE_HOJA = "PQRSDF"
+
+
+# ==================================================
+# CONEXIÓN GOOGLE SHEETS
+# ==================================================
+# gspread y google-auth se importan solo al conectarse: quien lee el
+# snapshot local (p. ej. `python -m pqrsdf notify`) no los carga.
+
+def conectar_google(ruta_credenciales=RUTA_CREDENCIALES):
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    scope = [
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive"
+    ]
+
+    creds = Credentials.from_service_account_file(ruta_credenciales, scopes=scope)
+    return gspread.authorize(creds)
+
+
+# ==================================================
+# FUENTES
+# ==================================================
+# Una fuente es cualquier objeto con estos métodos:
+#   version()                  -> marca que cambia cuando se edita la hoja
+#   encabezados()              -> valores de la fila 1
+#   claves(columna)            -> valores de `columna` (1-based) en las filas de datos, hasta la
+#                                 última con valor, normalizados como el num_caso del snapshot
+#   leer_todo()                -> filas de datos (lista de listas, ya tipadas)
+#   leer_rangos(rangos, ancho) -> {fila: valores} para cada (inicio, fin) en numeración de la hoja
+
+class FuenteGoogleSheets:
+
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+
+    def version(self):
+        with tramo("sheets.version"):
+            return self.worksheet.spreadsheet.get_lastUpdateTime()
+
+    def encabezados(self):
+        with tramo("sheets.encabezados"):
+            return [str(c) for c in self.worksheet.row_values(1)]
+
+    def claves(self, columna):
+        with tramo("sheets.claves"):
+            # Tipadas igual que las filas para que "007" o "7.0" comparen igual
+            return [str(v).strip() for v in self._tipar(self.worksheet.col_values(columna)[1:])]
+
+    def leer_todo(self):
+        with tramo("sheets.leer_todo") as t:
+            filas = [self._tipar(fila) for fila in self.worksheet.get_values()[1:]]
+            t["filas"] = len(filas)
+            return filas
+
+    def leer_rangos(self, rangos, ancho):
+        from gspread.utils import rowcol_to_a1
+
+        ultima_columna = rowcol_to_a1(1, ancho).rstrip("0123456789")
+        leidas = {}
+
+        with tramo("sheets.leer_rangos", rangos=len(rangos)) as t:
+            for i in range(0, len(rangos), RANGOS_POR_LLAMADA):
+                lote = rangos[i:i + RANGOS_POR_LLAMADA]
+                nombres = [f"A{inicio}:{ultima_columna}{fin}" for inicio, fin in lote]
+
+                for (inicio, fin), valores in zip(lote, self.worksheet.batch_get(nombres)):
+                    for fila in range(inicio, fin + 1):
+                        desplazamiento = fila - inicio
+                        # La API omite las filas vacías al final del rango
+                        valores_fila = valores[desplazamiento] if desplazamiento < len(valores) else []
+                        leidas[fila] = self._tipar(valores_fila)
+
+            t["filas"] = len(leidas)
+
+        return leidas
+
+    @staticmethod
+    def _tipar(fila):
+        from gspread.utils import numericise_all
+
+        # Mismo tratamiento que get_all_records()
+        return numericise_all(list(fila), default_blank="")
+
+
+class FuenteLocal:
+    # Hoja en memoria con la misma forma que la de Google (fila 1 = encabezados).
+    # Lleva la cuenta de filas leídas para verificar qué se descargó.
+
+    def __init__(self, valores):
+        self.valores = [list(fila) for fila in valores]
+        self._version = 0
+        self.filas_leidas = 0
+
+    def editar(self, fila, columna, valor):
+        while len(self.valores) < fila:
+            self.valores.append([])
+        registro = self.valores[fila - 1]
+        while len(registro) < columna:
+            registro.append("")
+        registro[columna - 1] = valor
+        self._version += 1
+
+    def agregar_fila(self, valores):
+        self.valores.append(list(valores))
+        self._version += 1
+
+    def borrar_fila(self, fila):
+        del self.valores[fila - 1]
+        self._version += 1
+
+    def version(self):
+        return str(self._version)
+
+    def encabezados(self):
+        return [str(c) for c in self.valores[0]] if self.valores else []
+
+    def claves(self, columna):
+        claves = [
+            "" if len(fila) < columna or fila[columna - 1] is None else str(fila[columna - 1]).strip()
+            for fila in self.valores[1:]
+        ]
+        while claves and not claves[-1]:
+            claves.pop()
+        return claves
+
+    def leer_todo(self):
+        self.filas_leidas += len(self.valores) - 1
+        return [list(fila) for fila in self.valores[1:]]
+
+    def leer_rangos(self, rangos, ancho):
+        leidas = {}
+        for inicio, fin in rangos:
+            for fila in range(inicio, fin + 1):
+                leidas[fila] = list(self.valores[fila - 1][:ancho]) if fila <= len(self.valores) else []
+                self.filas_leidas += 1
+        return leidas
+
+
+# ==================================================
+# SNAPSHOT LOCAL (SQLite)
+# ==================================================
+# Cada fila de la hoja se guarda como JSON para conservar los tipos que
+# entrega la fuente (números, textos) sin que SQLite los convierta.
+
+class Snapshot:
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        carpeta = os.path.dirname(ruta)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+
+        with closing(sqlite3.connect(self.ruta)) as con, con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS casos ("
+                "fila INTEGER PRIMARY KEY, num_caso TEXT, abierto INTEGER, datos TEXT)"
+            )
+            con.execute("CREATE INDEX IF NOT EXISTS idx_num_caso ON casos (num_caso)")
+            con.execute("CREATE TABLE IF NOT EXISTS meta (clave TEXT PRIMARY KEY, valor TEXT)")
+
+    def meta(self):
+        with closing(sqlite3.connect(self.ruta)) as con:
+            return {clave: json.loads(valor) for clave, valor in con.execute("SELECT clave, valor FROM meta")}
+
+    def filas(self):
+        # {fila: (num_caso, abierto)}
+        with closing(sqlite3.connect(self.ruta)) as con:
+            return {
+                fila: (num_caso, bool(abierto))
+                for fila, num_caso, abierto in con.execute("SELECT fila, num_caso, abierto FROM casos")
+            }
+
+    def dataframe(self):
+        meta = self.meta()
+        with tramo("snapshot.leer") as t, closing(sqlite3.connect(self.ruta)) as con:
+            datos = con.execute("SELECT datos FROM casos ORDER BY fila").fetchall()
+            t["filas"] = len(datos)
+            df = pd.DataFrame([json.loads(d) for (d,) in datos], columns=meta.get("encabezados", []))
+
+        # Versión de la hoja que refleja este df (ver `version_conocida` en sincronizar)
+        df.attrs["version_hoja"] = meta.get("version")
+        return df
+
+    def reemplazar(self, encabezados, filas, meta):
+        registros = [_registro(encabezados, fila, valores) for fila, valores in filas.items()]
+        with tramo("snapshot.reemplazar", filas=len(registros)), closing(sqlite3.connect(self.ruta)) as con, con:
+            con.execute("DELETE FROM casos")
+            con.executemany("INSERT INTO casos VALUES (?, ?, ?, ?)", registros)
+            self._guardar_meta(con, dict(meta, encabezados=encabezados))
+
+    def fusionar(self, encabezados, filas, meta):
+        registros = [_registro(encabezados, fila, valores) for fila, valores in filas.items()]
+        with tramo("snapshot.fusionar", filas=len(registros)), closing(sqlite3.connect(self.ruta)) as con, con:
+            # Fusión por fila: sincronizar ya comprobó que cada posición conserva
+            # su `num caso`. Un caso repetido en otra fila se conserva, igual
+            # que en la sincronización completa.
+            con.executemany("INSERT OR REPLACE INTO casos VALUES (?, ?, ?, ?)", registros)
+            self._guardar_meta(con, meta)
+
+    @staticmethod
+    def _guardar_meta(con, meta):
+        con.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [(clave, json.dumps(valor)) for clave, valor in meta.items()]
+        )
+
+
+def _indice(encabezados, nombre):
+    limpios = [e.strip() for e in encabezados]
+    return limpios.index(nombre) if nombre in limpios else None
+
+
+def _registro(encabezados, fila, valores):
+    valores = list(valores)[:len(encabezados)]
+    valores += [""] * (len(encabezados) - len(valores))
+
+    i_clave = _indice(encabezados, COLUMNA_CLAVE)
+    i_estado = _indice(encabezados, COLUMNA_ESTADO)
+
+    num_caso = str(valores[i_clave]).strip() if i_clave is not None else ""
+    abierto = i_estado is None or str(valores[i_estado]).strip().lower() != "cerrado"
+
+    return fila, num_caso, int(abierto), json.dumps(valores, ensure_ascii=False)
+
+
+def _agrupar(filas, hueco=HUECO_MAXIMO):
+    # [3, 4, 5, 9, 40] -> [(3, 9), (40, 40)]
+    rangos = []
+    for fila in sorted(filas):
+        if rangos and fila - rangos[-1][1] <= hueco + 1:
+            rangos[-1][1] = fila
+        else:
+            rangos.append([fila, fila])
+    return [tuple(r) for r in rangos]
+
+
+# ==================================================
+# SINCRONIZACIÓN
+# ==================================================
+def sincronizar(fuente, ruta, revision_completa_cada=REVISION_COMPLETA_CADA, version_conocida=None):
+    # version_conocida: df.attrs["version_hoja"] de lo que ya tiene quien
+    # llama; si la hoja sigue en esa versión se devuelve None y no se lee nada
+    snapshot = Snapshot(ruta)
+    meta = snapshot.meta()
+
+    version = fuente.version()
+    if version_conocida is not None and version == version_conocida:
+        return None
+
+    # 1. Sin cambios en la hoja: se usa el snapshot tal cual
+    if meta.get("version") == version:
+        return snapshot.dataframe()
+
+    encabezados = fuente.encabezados()
+    i_clave = _indice(encabezados, COLUMNA_CLAVE)
+
+    completa_vencida = time.time() - meta.get("ultima_completa", 0) > revision_completa_cada
+
+    if (
+        i_clave is None
+        or completa_vencida
+        or meta.get("encabezados") != encabezados
+    ):
+        return _sincronizacion_completa(fuente, snapshot, encabezados, version)
+
+    # 2. La columna `num caso` completa se compara fila por fila con el
+    # snapshot: cualquier borrado, inserción o reordenamiento (aunque solo
+    # toque casos cerrados) cambia el caso de alguna posición
+    n_previas = meta.get("num_filas", 0)
+    claves = fuente.claves(i_clave + 1)
+    n_actuales = len(claves)
+
+    previas = snapshot.filas()
+    if n_actuales < n_previas or any(
+        fila - 2 >= n_actuales or claves[fila - 2] != num_caso
+        for fila, (num_caso, _) in previas.items()
+    ):
+        return _sincronizacion_completa(fuente, snapshot, encabezados, version)
+
+    # 3. Filas nuevas al final + filas de casos abiertos (las únicas que suelen cambiar)
+    por_leer = [fila for fila, (_, abierto) in previas.items() if abierto]
+    por_leer += range(n_previas + 2, n_actuales + 2)
+
+    leidas = fuente.leer_rangos(_agrupar(por_leer), len(encabezados)) if por_leer else {}
+
+    # 4. La hoja pudo cambiar entre la lectura de claves y la de filas
+    for fila, valores in leidas.items():
+        if fila in previas:
+            num_caso = str(valores[i_clave]).strip() if len(valores) > i_clave else ""
+            if num_caso != previas[fila][0]:
+                return _sincronizacion_completa(fuente, snapshot, encabezados, version)
+
+    snapshot.fusionar(
+        encabezados,
+        leidas,
+        {"version": version, "num_filas": n_actuales}
+    )
+    return snapshot.dataframe()
+
+
+def _sincronizacion_completa(fuente, snapshot, encabezados, version):
+    filas = fuente.leer_todo()
+
+    # Se descartan las filas finales sin `num caso`, igual que claves()
+    i_clave = _indice(encabezados, COLUMNA_CLAVE)
+    if i_clave is not None:
+        while filas and (len(filas[-1]) <= i_clave or filas[-1][i_clave] in ("", None)):
+            filas.pop()
+
+    snapshot.reemplazar(
+        encabezados,
+        {i + 2: valores for i, valores in enumerate(filas)},
+        {"version": version, "num_filas": len(filas), "ultima_completa": time.time()}
+    )
+    return snapshot.dataframe()
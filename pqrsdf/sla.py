@@ -0,0 +1,109 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from pqrsdf.festivos import festivos_entre
+
+# ==================================================
+# MOTOR SLA EN DÍAS HÁBILES
+# ==================================================
+# Todos los cálculos son vectorizados con numpy.busday_* sobre el
+# calendario de festivos de Colombia; ninguna fecha se recorre en Python.
+
+# Términos de respuesta en días hábiles (Ley 1755 de 2015, art. 14)
+PLAZOS_DIAS_HABILES = {
+    "petición": 15,
+    "derecho de petición": 15,
+    "queja": 15,
+    "reclamo": 15,
+    "sugerencia": 15,
+    "denuncia": 15,
+    "felicitación": 15,
+    "solicitud de información": 10,
+    "solicitud de documentos": 10,
+    "consulta": 30,
+}
+PLAZO_POR_DEFECTO = 15
+
+# Con "Ext de tiempos" el término se amplía hasta el doble del inicial (art. 14, parágrafo)
+FACTOR_EXTENSION = 2
+
+# Primera columna encontrada con la fecha de radicación
+COLUMNAS_RADICACION = [
+    "Fecha radicado",
+    "Fecha radicación",
+    "Fecha de radicación",
+    "Fecha creación",
+    "Fecha de creación"
+]
+
+VALORES_SI = {"si", "sí", "s", "x", "true", "1"}
+
+ANIO_INICIAL = 2000
+ANIO_FINAL = 2060
+
+
+@lru_cache(maxsize=1)
+def calendario():
+    return np.busdaycalendar(
+        weekmask="1111100",
+        holidays=np.array(festivos_entre(ANIO_INICIAL, ANIO_FINAL), dtype="datetime64[D]")
+    )
+
+
+def calcular_sla(df, hoy):
+    cal = calendario()
+    hoy = np.datetime64(pd.Timestamp(hoy).date(), "D")
+
+    # Plazo por categoría (se resuelve sobre las categorías, no por fila)
+    categorias = df['Categoría'].astype("category")
+    plazos = np.array(
+        [PLAZOS_DIAS_HABILES.get(str(c).strip().lower(), PLAZO_POR_DEFECTO) for c in categorias.cat.categories],
+        dtype=np.int64
+    )
+    codigos = categorias.cat.codes.to_numpy()
+    plazo = np.where(codigos >= 0, plazos[codigos] if len(plazos) else PLAZO_POR_DEFECTO, PLAZO_POR_DEFECTO)
+
+    extension = _es_si(df['Ext de tiempos']) if 'Ext de tiempos' in df.columns else np.zeros(len(df), dtype=bool)
+    plazo = np.where(extension, plazo * FACTOR_EXTENSION, plazo)
+
+    # Vencimiento legal = radicación + plazo en días hábiles
+    vencimiento_legal = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[D]")
+    columna_radicacion = next((c for c in COLUMNAS_RADICACION if c in df.columns), None)
+
+    if columna_radicacion is not None:
+        radicado = _fechas(df[columna_radicacion])
+        validas = ~np.isnat(radicado)
+        vencimiento_legal[validas] = np.busday_offset(
+            radicado[validas], plazo[validas], roll="forward", busdaycal=cal
+        )
+
+    # La fecha de la hoja manda; la legal solo cubre los casos sin fecha
+    vencimiento = _fechas(df['Fecha cierre'])
+    sin_fecha = np.isnat(vencimiento)
+    vencimiento[sin_fecha] = vencimiento_legal[sin_fecha]
+
+    # Días hábiles desde hoy hasta el vencimiento (negativo si ya venció)
+    dias = np.full(len(df), np.nan)
+    con_fecha = ~np.isnat(vencimiento)
+    dias[con_fecha] = np.busday_count(hoy, vencimiento[con_fecha], busdaycal=cal)
+
+    return pd.DataFrame({
+        "Plazo (días hábiles)": plazo,
+        "Extensión": extension,
+        "Vencimiento legal": pd.to_datetime(vencimiento_legal),
+        "Vencimiento": pd.to_datetime(vencimiento),
+        # float con NaN para los casos sin fecha, igual que .dt.days
+        "Dias_restantes": dias,
+    }, index=df.index)
+
+
+def _fechas(serie):
+    if not pd.api.types.is_datetime64_any_dtype(serie):
+        serie = pd.to_datetime(serie, errors="coerce")
+    return serie.to_numpy(dtype="datetime64[D]")
+
+
+def _es_si(serie):
+    return serie.astype(str).str.strip().str.lower().isin(VALORES_SI).to_numpy()
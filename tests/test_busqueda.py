@@ -0,0 +1,41 @@
+import pandas as pd
+
+from pqrsdf.busqueda import IndiceCasos
+
+
+def indice():
+    return IndiceCasos(pd.DataFrame({
+        "num caso": ["2025-001", "2025-002", "2024-010"],
+        "Nombre solicitante": ["Ana Gómez", "Juan Pérez", "Luisa Díaz"],
+        "Descripción": ["Certificado de notas", "Queja por matrícula", "Reclamo de matrícula"],
+    }))
+
+
+def casos(resultado):
+    return resultado[0]["num caso"].tolist()
+
+
+def test_indice_vacio():
+    vacio = IndiceCasos(pd.DataFrame({"num caso": [], "Descripción": []}))
+
+    resultado, faltantes = vacio.buscar_numeros(["1", "2"])
+    assert resultado.empty and faltantes == ["1", "2"]
+    assert vacio.buscar_prefijo("20")[1] == 0
+    assert vacio.buscar_texto("gomz")[1] == 0
+
+
+def test_numeros_y_prefijo():
+    resultado, faltantes = indice().buscar_numeros(["2025-002", "9999"])
+    assert resultado["num caso"].tolist() == ["2025-002"] and faltantes == ["9999"]
+    assert casos(indice().buscar_prefijo("2025")) == ["2025-001", "2025-002"]
+
+
+def test_texto_por_prefijo_sin_tildes():
+    assert casos(indice().buscar_texto("matri")) == ["2025-002", "2024-010"]
+    assert casos(indice().buscar_texto("GOMEZ cert")) == ["2025-001"]
+
+
+def test_texto_difuso_con_errores_de_tipeo():
+    assert casos(indice().buscar_texto("gomz")) == ["2025-001"]
+    assert casos(indice().buscar_texto("reclamo matricla")) == ["2024-010"]
+    assert casos(indice().buscar_texto("xyzw")) == []
@@ -0,0 +1,108 @@
+import smtplib
+from email.message import EmailMessage
+
+import pytest
+
+from benchmarks.sumidero_smtp import SumideroSMTP
+from pqrsdf.envio import Despachador, Mensaje, es_transitorio
+
+
+@pytest.fixture
+def sumidero():
+    with SumideroSMTP() as servidor:
+        yield servidor
+
+
+def mensaje(clave="rectoría"):
+    contenido = EmailMessage()
+    contenido["Subject"] = f"PQRSDF {clave}"
+    contenido.set_content("casos en proceso")
+    return Mensaje(clave, "pqrsdf@example.invalid", ["a@example.invalid"], contenido)
+
+
+def despachador(sumidero, esperas, **kwargs):
+    return Despachador(
+        host="127.0.0.1",
+        puerto=sumidero.puerto,
+        starttls=False,
+        mensajes_por_minuto=None,
+        conexiones=1,
+        timeout=5,
+        dormir=esperas.append,
+        **kwargs
+    )
+
+
+def test_entrega_reutiliza_la_conexion(sumidero):
+    esperas = []
+    entregas = despachador(sumidero, esperas).enviar([mensaje("a"), mensaje("b"), mensaje("c")])
+
+    assert [e.enviado for e in entregas] == [True, True, True]
+    assert [e.intentos for e in entregas] == [1, 1, 1]
+    assert sumidero.recibidos == 3
+    assert sumidero.conexiones == 1
+    assert esperas == []
+
+
+def test_4xx_se_reintenta_y_se_entrega(sumidero):
+    sumidero.fallos = ["451 intente más tarde", "421 ocupado"]
+    esperas = []
+
+    entrega, = despachador(sumidero, esperas, espera_inicial=2.0).enviar([mensaje()])
+
+    assert entrega.enviado and entrega.intentos == 3 and entrega.error == ""
+    assert sumidero.recibidos == 1
+    # Espera exponencial con ±20 % de variación: ~2 s y ~4 s
+    assert len(esperas) == 2
+    assert 1.6 <= esperas[0] <= 2.4 and 3.2 <= esperas[1] <= 4.8
+
+
+def test_5xx_falla_en_el_primer_intento(sumidero):
+    sumidero.fallos = ["554 mensaje rechazado"]
+    esperas = []
+
+    entrega, = despachador(sumidero, esperas).enviar([mensaje()])
+
+    assert not entrega.enviado
+    assert entrega.intentos == 1
+    assert "554" in entrega.error
+    assert esperas == []
+    assert sumidero.recibidos == 0
+
+
+def test_conexion_caida_se_descarta_y_se_reabre(sumidero):
+    sumidero.fallos = ["cortar"]
+    esperas = []
+
+    entrega, = despachador(sumidero, esperas).enviar([mensaje()])
+
+    assert entrega.enviado and entrega.intentos == 2
+    assert sumidero.conexiones == 2
+    assert sumidero.recibidos == 1
+    assert len(esperas) == 1
+
+
+def test_reintentos_agotados(sumidero):
+    sumidero.fallos = ["451 intente más tarde"] * 3
+    esperas = []
+
+    entrega, = despachador(sumidero, esperas, reintentos=2).enviar([mensaje()])
+
+    assert not entrega.enviado
+    assert entrega.intentos == 3
+    assert "451" in entrega.error
+    assert len(esperas) == 2
+
+
+@pytest.mark.parametrize("error, transitorio", [
+    (smtplib.SMTPDataError(451, b"luego"), True),
+    (smtplib.SMTPDataError(554, b"no"), False),
+    (smtplib.SMTPAuthenticationError(535, b"clave"), False),
+    (smtplib.SMTPServerDisconnected("cortada"), True),
+    (smtplib.SMTPRecipientsRefused({"a@x.co": (450, b"buzon ocupado")}), True),
+    (smtplib.SMTPRecipientsRefused({"a@x.co": (450, b"luego"), "b@x.co": (550, b"no existe")}), False),
+    (ConnectionResetError(), True),
+    (ValueError("otro"), False),
+])
+def test_es_transitorio(error, transitorio):
+    assert es_transitorio(error) is transitorio
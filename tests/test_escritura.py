@@ -0,0 +1,146 @@
+import pytest
+
+from pqrsdf.escritura import ColaEscritura, HojaLocal
+
+
+class ErrorAPI(Exception):
+    # Como gspread.exceptions.APIError: el código HTTP en .code
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+def hoja(**kwargs):
+    return HojaLocal([["num caso ", "Estado"], [1, "En proceso"], [2, "Cerrado"], [3, "En proceso"]], **kwargs)
+
+
+def cola(worksheet, esperas=None):
+    return ColaEscritura(
+        worksheet,
+        solicitudes_por_minuto=None,
+        dormir=(esperas.append if esperas is not None else lambda segundos: None)
+    )
+
+
+def test_actualizaciones_del_mismo_caso_se_funden():
+    h = hoja()
+    c = cola(h)
+
+    c.encolar(1, {"Vencido": "No", "Notificado a": "a@x.co"})
+    c.encolar("1 ", {"Vencido": "Sí"})
+    assert c.pendientes == 1
+
+    resultado = c.vaciar()
+
+    assert (resultado.casos, resultado.celdas) == (1, 2)
+    assert h.valores[1][2:] == ["Sí", "a@x.co"]
+    assert h.solicitudes.count("batch_update") == 1
+    assert c.pendientes == 0
+
+
+def test_columnas_faltantes_van_al_final_del_encabezado():
+    h = hoja()
+    c = cola(h)
+
+    c.encolar(3, {"Última notificación": "2026-10-17 08:00", "Vencido": "No"})
+    resultado = c.vaciar()
+
+    assert h.col_count == 4
+    assert h.solicitudes == ["row_values", "add_cols", "col_values", "batch_update"]
+    assert h.valores[0] == ["num caso ", "Estado", "Última notificación", "Vencido"]
+    assert h.valores[3] == [3, "En proceso", "2026-10-17 08:00", "No"]
+    assert resultado.solicitudes == 4
+
+
+def test_columnas_existentes_no_agregan_columnas():
+    h = HojaLocal([["num caso", "Vencido", "Estado"], [7, "", "Cerrado"]])
+    c = cola(h)
+
+    c.encolar(7, {"Vencido": "Sí"})
+    c.vaciar()
+
+    assert "add_cols" not in h.solicitudes
+    assert h.valores == [["num caso", "Vencido", "Estado"], [7, "Sí", "Cerrado"]]
+
+
+def test_casos_que_ya_no_estan_en_la_hoja():
+    h = hoja()
+    c = cola(h)
+
+    c.encolar(2, {"Vencido": "No"})
+    c.encolar(99, {"Vencido": "Sí"})
+    resultado = c.vaciar()
+
+    assert resultado.sin_fila == ["99"]
+    assert resultado.celdas == 1
+
+
+def test_429_se_reintenta_con_espera_creciente():
+    h = hoja(fallos=[ErrorAPI(429), ErrorAPI(429)])
+    esperas = []
+    c = cola(h, esperas)
+
+    c.encolar(1, {"Vencido": "No"})
+    resultado = c.vaciar()
+
+    assert h.valores[1][2] == "No"
+    assert len(esperas) == 2 and esperas[1] > esperas[0]
+    assert resultado.solicitudes == 6
+
+
+def test_error_permanente_no_se_reintenta():
+    h = hoja(fallos=[ErrorAPI(403)])
+    esperas = []
+    c = cola(h, esperas)
+
+    c.encolar(1, {"Vencido": "No"})
+    with pytest.raises(ErrorAPI):
+        c.vaciar()
+
+    assert esperas == []
+    assert h.solicitudes == ["row_values"]
+
+
+def test_lote_fallido_vuelve_a_la_cola():
+    h = hoja()
+    c = cola(h)
+    c.encolar(1, {"Vencido": "No", "Notificado a": "a@x.co"})
+
+    # Falla el batch_update después de leer encabezado y claves
+    batch_update = h.batch_update
+
+    def falla_una_vez(data, raw=True):
+        h.batch_update = batch_update
+        # Mientras tanto llega una actualización más nueva del mismo caso
+        c.encolar(1, {"Vencido": "Sí"})
+        raise ErrorAPI(400)
+
+    h.batch_update = falla_una_vez
+    with pytest.raises(ErrorAPI):
+        c.vaciar()
+
+    assert c.pendientes == 1
+    resultado = c.vaciar()
+
+    assert resultado.casos == 1
+    assert dict(zip(h.valores[0][2:], h.valores[1][2:])) == {"Vencido": "Sí", "Notificado a": "a@x.co"}
+    assert c.pendientes == 0
+
+
+def test_cola_vacia_no_llama_a_la_hoja():
+    h = hoja()
+    assert cola(h).vaciar().solicitudes == 0
+    assert h.solicitudes == []
+
+
+def test_respeta_el_ritmo_de_solicitudes():
+    h = hoja()
+    esperas = []
+    c = ColaEscritura(h, solicitudes_por_minuto=60, dormir=esperas.append)
+
+    c.encolar(1, {"Estado": "Cerrado"})
+    c.vaciar()
+
+    # row_values, col_values, batch_update a un segundo una de otra (el
+    # `dormir` de prueba no avanza el reloj, así que las esperas se acumulan)
+    assert esperas == pytest.approx([0, 1, 2], abs=0.05)
@@ -0,0 +1,44 @@
+from datetime import date
+
+from pqrsdf.festivos import festivos_colombia, festivos_entre, pascua
+
+
+def test_pascua():
+    assert pascua(2024) == date(2024, 3, 31)
+    assert pascua(2025) == date(2025, 4, 20)
+    assert pascua(2026) == date(2026, 4, 5)
+
+
+def test_festivos_2025():
+    assert festivos_colombia(2025) == [
+        date(2025, 1, 1),    # Año Nuevo
+        date(2025, 1, 6),    # Reyes Magos (lunes)
+        date(2025, 3, 24),   # San José, 19 mar -> lunes 24
+        date(2025, 4, 17),   # Jueves Santo
+        date(2025, 4, 18),   # Viernes Santo
+        date(2025, 5, 1),    # Día del Trabajo
+        date(2025, 6, 2),    # Ascensión, jueves 29 may -> lunes
+        date(2025, 6, 23),   # Corpus Christi, jueves 19 jun -> lunes
+        date(2025, 6, 30),   # San Pedro (domingo 29) y Sagrado Corazón (viernes 27) caen el mismo lunes
+        date(2025, 7, 20),   # Independencia (domingo, no se traslada)
+        date(2025, 8, 7),    # Batalla de Boyacá
+        date(2025, 8, 18),   # Asunción, 15 ago -> lunes
+        date(2025, 10, 13),  # Día de la Raza, domingo 12 -> lunes
+        date(2025, 11, 3),   # Todos los Santos, sábado 1 -> lunes
+        date(2025, 11, 17),  # Independencia de Cartagena, martes 11 -> lunes
+        date(2025, 12, 8),   # Inmaculada Concepción
+        date(2025, 12, 25),  # Navidad
+    ]
+
+
+def test_trasladables_siempre_en_lunes():
+    fijos = {(1, 1), (5, 1), (7, 20), (8, 7), (12, 8), (12, 25)}
+    for anio in range(2020, 2031):
+        semana_santa = {pascua(anio).toordinal() - 3, pascua(anio).toordinal() - 2}
+        for festivo in festivos_colombia(anio):
+            if (festivo.month, festivo.day) not in fijos and festivo.toordinal() not in semana_santa:
+                assert festivo.weekday() == 0, festivo
+
+
+def test_festivos_entre():
+    assert len(festivos_entre(2025, 2026)) == len(festivos_colombia(2025)) + len(festivos_colombia(2026))
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from pqrsdf.refresco import Refrescador
+
+
+def test_version_solo_sube_si_los_datos_cambian():
+    cargas = []
+    datos = {"df": pd.DataFrame({"a": [1]})}
+
+    def cargar(vigente):
+        cargas.append(vigente)
+        return datos["df"]
+
+    refrescador = Refrescador(cargar)
+    df, version = refrescador.obtener()
+    assert version == 1 and cargas == [None]
+
+    # Refresco sin cambios: el cargador devuelve el mismo df
+    antes = refrescador.antiguedad()
+    refrescador._refrescar()
+    actual, version = refrescador.obtener()
+    assert actual is df and version == 1
+    assert cargas[-1] is df
+    assert refrescador.antiguedad() <= antes
+
+    datos["df"] = pd.DataFrame({"a": [2]})
+    refrescador._refrescar()
+    nuevo, version = refrescador.obtener()
+    assert version == 2 and nuevo is datos["df"]
+
+
+def test_error_conserva_la_ultima_version_buena():
+    respuestas = [pd.DataFrame({"a": [1]}), RuntimeError("sin red")]
+
+    def cargar(vigente):
+        respuesta = respuestas.pop(0)
+        if isinstance(respuesta, Exception):
+            raise respuesta
+        return respuesta
+
+    refrescador = Refrescador(cargar)
+    df, version = refrescador.obtener()
+    refrescador._refrescar()
+
+    actual, ultima = refrescador.obtener()
+    assert actual is df and ultima == version
+    assert str(refrescador.error) == "sin red"
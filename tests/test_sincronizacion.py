@@ -0,0 +1,154 @@
+from pqrsdf.sincronizacion import FuenteLocal, sincronizar
+
+ENCABEZADOS = ["num caso ", "Estado", "Detalle"]
+
+
+def hoja(*estados):
+    # Caso i en la fila i + 1 con el estado dado
+    return FuenteLocal([ENCABEZADOS] + [[i, estado, f"caso {i}"] for i, estado in enumerate(estados, start=1)])
+
+
+def casos(df):
+    return df["num caso "].tolist()
+
+
+def sincronizada(fuente, tmp_path):
+    ruta = str(tmp_path / "pqrsdf.sqlite")
+    sincronizar(fuente, ruta)
+    fuente.filas_leidas = 0
+    return ruta
+
+
+def test_primera_sincronizacion_lee_todo(tmp_path):
+    fuente = hoja("Cerrado", "En proceso", "Cerrado")
+    df = sincronizar(fuente, str(tmp_path / "pqrsdf.sqlite"))
+
+    assert casos(df) == [1, 2, 3]
+    assert df.columns.tolist() == ENCABEZADOS
+    assert fuente.filas_leidas == 3
+
+
+def test_sin_cambios_no_lee_filas(tmp_path):
+    fuente = hoja("Cerrado", "En proceso")
+    ruta = sincronizada(fuente, tmp_path)
+
+    assert casos(sincronizar(fuente, ruta)) == [1, 2]
+    assert fuente.filas_leidas == 0
+
+
+def test_solo_relee_abiertos_y_filas_nuevas(tmp_path):
+    # Abierto y fila nueva separados por más de HUECO_MAXIMO cerrados
+    fuente = hoja("En proceso", *["Cerrado"] * 30)
+    ruta = sincronizada(fuente, tmp_path)
+
+    fuente.editar(2, 3, "actualizado")
+    fuente.agregar_fila([32, "En proceso", "nuevo"])
+    df = sincronizar(fuente, ruta)
+
+    assert casos(df) == list(range(1, 33))
+    assert df["Detalle"].tolist()[0] == "actualizado"
+    assert fuente.filas_leidas == 2
+
+
+def test_caso_que_se_cierra_deja_de_releerse(tmp_path):
+    fuente = hoja("En proceso", "Cerrado")
+    ruta = sincronizada(fuente, tmp_path)
+
+    fuente.editar(2, 2, "Cerrado")
+    assert sincronizar(fuente, ruta)["Estado"].tolist() == ["Cerrado", "Cerrado"]
+
+    fuente.filas_leidas = 0
+    fuente.agregar_fila([3, "Cerrado", ""])
+    sincronizar(fuente, ruta)
+    assert fuente.filas_leidas == 1
+
+
+def test_borrado_de_cerrado_mas_fila_nueva(tmp_path):
+    # El conteo de filas no cambia y ningún abierto se movió
+    fuente = hoja("Cerrado", "Cerrado", "Cerrado", "Cerrado", "Cerrado")
+    ruta = sincronizada(fuente, tmp_path)
+
+    fuente.borrar_fila(3)
+    fuente.agregar_fila([6, "En proceso", "nuevo"])
+
+    assert casos(sincronizar(fuente, ruta)) == [1, 3, 4, 5, 6]
+
+
+def test_borrado_al_final(tmp_path):
+    fuente = hoja("Cerrado", "En proceso", "Cerrado")
+    ruta = sincronizada(fuente, tmp_path)
+
+    fuente.borrar_fila(4)
+
+    assert casos(sincronizar(fuente, ruta)) == [1, 2]
+
+
+def test_reordenamiento_de_cerrados(tmp_path):
+    fuente = hoja("Cerrado", "Cerrado", "En proceso")
+    ruta = sincronizada(fuente, tmp_path)
+
+    fuente.valores[1], fuente.valores[2] = fuente.valores[2], fuente.valores[1]
+    fuente.editar(1, 1, ENCABEZADOS[0])
+
+    df = sincronizar(fuente, ruta)
+    assert casos(df) == [2, 1, 3]
+    assert df["Detalle"].tolist() == ["caso 2", "caso 1", "caso 3"]
+
+
+def test_cambio_de_encabezados_relee_todo(tmp_path):
+    fuente = hoja("Cerrado", "En proceso")
+    ruta = sincronizada(fuente, tmp_path)
+
+    fuente.editar(1, 4, "Vencido")
+    fuente.editar(2, 4, "No")
+    df = sincronizar(fuente, ruta)
+
+    assert df.columns.tolist() == ENCABEZADOS + ["Vencido"]
+    assert df["Vencido"].tolist() == ["No", ""]
+    assert fuente.filas_leidas == 2
+
+
+def test_caso_repetido_se_conserva_igual_que_en_la_completa(tmp_path):
+    # Un `num caso` repetido no borra la otra fila: la incremental y la
+    # completa devuelven lo mismo, y el abierto se sigue releyendo
+    fuente = hoja("Cerrado", "En proceso", "Cerrado")
+    ruta = sincronizada(fuente, tmp_path)
+
+    fuente.agregar_fila([2, "Cerrado", "reingresado"])
+    incremental = sincronizar(fuente, ruta)
+
+    assert casos(incremental) == [1, 2, 3, 2]
+    assert incremental["Detalle"].tolist() == ["caso 1", "caso 2", "caso 3", "reingresado"]
+
+    completa = sincronizar(fuente, str(tmp_path / "otra.sqlite"))
+    assert incremental.equals(completa)
+
+    fuente.editar(3, 3, "sigue abierto")
+    assert sincronizar(fuente, ruta)["Detalle"].tolist()[1] == "sigue abierto"
+
+
+def test_revision_completa_periodica(tmp_path):
+    fuente = hoja("Cerrado", "Cerrado")
+    ruta = str(tmp_path / "pqrsdf.sqlite")
+    sincronizar(fuente, ruta)
+
+    # Edición en un caso cerrado: solo la revisión completa la ve
+    fuente.editar(2, 3, "corregido")
+    assert sincronizar(fuente, ruta)["Detalle"].tolist()[0] == "caso 1"
+
+    fuente.editar(3, 3, "corregido")
+    df = sincronizar(fuente, ruta, revision_completa_cada=-1)
+    assert df["Detalle"].tolist() == ["corregido", "corregido"]
+
+
+def test_version_conocida_sin_cambios_no_lee_nada(tmp_path):
+    fuente = hoja("Cerrado", "En proceso")
+    ruta = str(tmp_path / "pqrsdf.sqlite")
+    df = sincronizar(fuente, ruta)
+
+    assert sincronizar(fuente, ruta, version_conocida=df.attrs["version_hoja"]) is None
+
+    fuente.editar(3, 3, "cambio")
+    nuevo = sincronizar(fuente, ruta, version_conocida=df.attrs["version_hoja"])
+    assert nuevo["Detalle"].tolist() == ["caso 1", "cambio"]
+    assert nuevo.attrs["version_hoja"] == fuente.version() != df.attrs["version_hoja"]
@@ -0,0 +1,74 @@
+import pandas as pd
+
+from pqrsdf.sla import calcular_sla
+
+
+def casos(*filas):
+    # (categoría, ext de tiempos, fecha radicado, fecha cierre)
+    df = pd.DataFrame(filas, columns=["Categoría", "Ext de tiempos", "Fecha radicado", "Fecha cierre"])
+    df["Fecha cierre"] = pd.to_datetime(df["Fecha cierre"])
+    return df
+
+
+def test_vencimiento_legal_salta_festivos():
+    # Viernes 7 mar 2025 + 15 días hábiles; el lunes 24 mar es festivo (San José)
+    sla = calcular_sla(casos(("Queja", "", "2025-03-07", None)), "2025-03-10").iloc[0]
+
+    assert sla["Plazo (días hábiles)"] == 15
+    assert sla["Vencimiento legal"] == pd.Timestamp("2025-03-31")
+    assert sla["Vencimiento"] == pd.Timestamp("2025-03-31")
+    # Del lunes 10 al 28 de marzo: 15 días hábiles menos el festivo
+    assert sla["Dias_restantes"] == 14
+
+
+def test_radicado_en_fin_de_semana_empieza_el_lunes():
+    # Sábado 1 mar 2025 -> lunes 3 + 15 días hábiles (sin el 24 de marzo)
+    sla = calcular_sla(casos(("Queja", "", "2025-03-01", None)), "2025-03-10").iloc[0]
+
+    assert sla["Vencimiento legal"] == pd.Timestamp("2025-03-25")
+    assert sla["Dias_restantes"] == 10
+
+
+def test_vencimiento_en_fin_de_semana():
+    # Fecha de cierre el sábado 1 mar 2025: quedan lunes a viernes
+    sla = calcular_sla(casos(("Petición", "", "2025-02-10", "2025-03-01")), "2025-02-24").iloc[0]
+
+    assert sla["Vencimiento"] == pd.Timestamp("2025-03-01")
+    assert sla["Dias_restantes"] == 5
+
+
+def test_vencimiento_en_festivo():
+    # Lunes 30 jun 2025 es festivo
+    df = casos(("Petición", "", "2025-06-01", "2025-06-30"))
+
+    assert calcular_sla(df, "2025-06-24")["Dias_restantes"].iloc[0] == 4
+    # Vencido: cuentan el 1 y 2 de julio, no el festivo
+    assert calcular_sla(df, "2025-07-02")["Dias_restantes"].iloc[0] == -2
+
+
+def test_extension_de_tiempos_duplica_el_plazo():
+    # 30 días hábiles desde el 7 mar 2025: salta San José y Jueves/Viernes Santo
+    sla = calcular_sla(casos(("Queja", "Sí", "2025-03-07", None)), "2025-03-10").iloc[0]
+
+    assert sla["Extensión"]
+    assert sla["Plazo (días hábiles)"] == 30
+    assert sla["Vencimiento legal"] == pd.Timestamp("2025-04-23")
+
+
+def test_plazo_por_categoria_y_sin_fecha():
+    df = casos(
+        ("Solicitud de información", "", "2025-03-07", None),
+        ("Otra categoría", "", "", None),
+    )
+    sla = calcular_sla(df, "2025-03-10")
+
+    assert sla["Plazo (días hábiles)"].tolist() == [10, 15]
+    assert sla["Vencimiento"].iloc[0] == pd.Timestamp("2025-03-21")
+    assert pd.isna(sla["Vencimiento"].iloc[1]) and pd.isna(sla["Dias_restantes"].iloc[1])
+
+
+def test_fecha_de_cierre_manda_sobre_la_legal():
+    sla = calcular_sla(casos(("Queja", "", "2025-03-07", "2025-04-30")), "2025-03-10").iloc[0]
+
+    assert sla["Vencimiento legal"] == pd.Timestamp("2025-03-31")
+    assert sla["Vencimiento"] == pd.Timestamp("2025-04-30")